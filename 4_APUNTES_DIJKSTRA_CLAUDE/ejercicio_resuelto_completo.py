@@ -32,6 +32,8 @@ Tarea: Encontrar las rutas más cortas desde el almacén A hacia todos los demá
 ===================================================================================
 """
 
+import time
+
 
 # ===================================================================================
 # PASO 1: DEFINIR LAS ESTRUCTURAS DE NODOS
@@ -79,6 +81,7 @@ class NodoGrafo:
     - distancia: distancia mínima desde origen (para Dijkstra)
     - predecesor: nodo previo en el camino más corto (para Dijkstra)
     - visitado: marca si ya fue procesado (para Dijkstra)
+    - almacen_asignado: origen más cercano (para Dijkstra multiorigen)
     """
     def __init__(self, identificador):
         self.id = identificador
@@ -86,6 +89,7 @@ class NodoGrafo:
         self.distancia = float('inf')  # Inicialmente: distancia infinita
         self.predecesor = None      # Inicialmente: sin predecesor
         self.visitado = False       # Inicialmente: no visitado
+        self.almacen_asignado = None  # Inicialmente: sin origen asignado
     
     def agregar_ruta(self, destino, distancia_km):
         """Agrega una ruta desde este almacén hacia otro"""
@@ -129,8 +133,9 @@ class ArbolAVL:
     Árbol Binario de Búsqueda Auto-balanceado AVL
     Mantiene operaciones O(log n) mediante rotaciones
     """
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.raiz = None
+        self.verbose = verbose  # False: sin traza de inserciones, borrados y balanceos
     
     # -------- FUNCIONES AUXILIARES --------
     
@@ -248,23 +253,27 @@ class ArbolAVL:
         
         # Caso 1: LL (Left-Left)
         if balance > 1 and self.factor_equilibrio(nodo.izquierdo) >= 0:
-            print(f"  [Balanceo] Caso LL en {nodo.clave}")
+            if self.verbose:
+                print(f"  [Balanceo] Caso LL en {nodo.clave}")
             return self.rotacion_derecha(nodo)
         
         # Caso 2: RR (Right-Right)
         if balance < -1 and self.factor_equilibrio(nodo.derecho) <= 0:
-            print(f"  [Balanceo] Caso RR en {nodo.clave}")
+            if self.verbose:
+                print(f"  [Balanceo] Caso RR en {nodo.clave}")
             return self.rotacion_izquierda(nodo)
         
         # Caso 3: LR (Left-Right)
         if balance > 1 and self.factor_equilibrio(nodo.izquierdo) < 0:
-            print(f"  [Balanceo] Caso LR en {nodo.clave}")
+            if self.verbose:
+                print(f"  [Balanceo] Caso LR en {nodo.clave}")
             nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
             return self.rotacion_derecha(nodo)
         
         # Caso 4: RL (Right-Left)
         if balance < -1 and self.factor_equilibrio(nodo.derecho) > 0:
-            print(f"  [Balanceo] Caso RL en {nodo.clave}")
+            if self.verbose:
+                print(f"  [Balanceo] Caso RL en {nodo.clave}")
             nodo.derecho = self.rotacion_derecha(nodo.derecho)
             return self.rotacion_izquierda(nodo)
         
@@ -275,60 +284,97 @@ class ArbolAVL:
     
     def insertar(self, clave, valor=None):
         """Inserta un elemento en el AVL manteniendo balance"""
-        print(f"  [AVL] Insertando {clave}")
-        self.raiz = self._insertar_recursivo(self.raiz, clave, valor)
-    
-    def _insertar_recursivo(self, nodo, clave, valor):
-        """Función recursiva auxiliar para insertar"""
-        # Caso base: posición encontrada
-        if nodo is None:
-            return NodoAVL(clave, valor)
+        if self.verbose:
+            print(f"  [AVL] Insertando {clave}")
+        
+        # Árbol vacío: el nuevo nodo es la raíz
+        if self.raiz is None:
+            self.raiz = NodoAVL(clave, valor)
+            return
         
-        # Inserción BST estándar
-        if clave < nodo.clave:
-            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, clave, valor)
-        elif clave > nodo.clave:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, clave, valor)
+        # Inserción BST estándar sin recursión: se guarda el camino en una pila
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            if clave == nodo.clave:
+                # Clave duplicada: actualizar valor
+                nodo.valor = valor
+                return
+            camino.append(nodo)
+            nodo = nodo.izquierdo if clave < nodo.clave else nodo.derecho
+        
+        padre = camino[-1]
+        if clave < padre.clave:
+            padre.izquierdo = NodoAVL(clave, valor)
         else:
-            # Clave duplicada: actualizar valor
-            nodo.valor = valor
-            return nodo
+            padre.derecho = NodoAVL(clave, valor)
         
-        # Balancear después de insertar
-        return self.balancear(nodo)
+        # Balancear después de insertar, de abajo arriba
+        self._retrazar(camino)
+    
+    def _retrazar(self, camino):
+        """
+        Balancea los nodos del camino desde el más profundo hacia la raíz.
+        
+        Se detiene en cuanto un subárbol conserva la altura que tenía:
+        por encima de él ninguna altura ni factor de equilibrio cambia.
+        """
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            altura_previa = nodo.altura
+            subarbol = self.balancear(nodo)
+            
+            # Enganchar la nueva raíz del subárbol en su padre
+            if subarbol is not nodo:
+                if i == 0:
+                    self.raiz = subarbol
+                elif camino[i - 1].izquierdo is nodo:
+                    camino[i - 1].izquierdo = subarbol
+                else:
+                    camino[i - 1].derecho = subarbol
+            
+            if subarbol.altura == altura_previa:
+                break
     
     def eliminar(self, clave):
         """Elimina un elemento del AVL manteniendo balance"""
-        print(f"  [AVL] Eliminando {clave}")
-        self.raiz = self._eliminar_recursivo(self.raiz, clave)
-    
-    def _eliminar_recursivo(self, nodo, clave):
-        """Función recursiva auxiliar para eliminar"""
-        if nodo is None:
-            return None
+        if self.verbose:
+            print(f"  [AVL] Eliminando {clave}")
         
-        # Buscar el nodo a eliminar
-        if clave < nodo.clave:
-            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, clave)
-        elif clave > nodo.clave:
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, clave)
-        else:
-            # Nodo encontrado
-            # Caso 1 y 2: nodo con 0 o 1 hijo
-            if nodo.izquierdo is None:
-                return nodo.derecho
-            elif nodo.derecho is None:
-                return nodo.izquierdo
-            
-            # Caso 3: nodo con 2 hijos
-            # Encontrar sucesor (mínimo del subárbol derecho)
-            sucesor = self._minimo_nodo(nodo.derecho)
+        # Buscar el nodo a eliminar guardando el camino en una pila
+        camino = []
+        nodo = self.raiz
+        while nodo is not None and clave != nodo.clave:
+            camino.append(nodo)
+            nodo = nodo.izquierdo if clave < nodo.clave else nodo.derecho
+        
+        if nodo is None:
+            return
+        
+        # Caso 3: nodo con 2 hijos
+        # Copiar el sucesor (mínimo del subárbol derecho) y eliminar el sucesor
+        if nodo.izquierdo is not None and nodo.derecho is not None:
+            camino.append(nodo)
+            sucesor = nodo.derecho
+            while sucesor.izquierdo is not None:
+                camino.append(sucesor)
+                sucesor = sucesor.izquierdo
             nodo.clave = sucesor.clave
             nodo.valor = sucesor.valor
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, sucesor.clave)
+            nodo = sucesor
+        
+        # Caso 1 y 2: nodo con 0 o 1 hijo, que ocupa su lugar
+        hijo = nodo.izquierdo if nodo.izquierdo is not None else nodo.derecho
+        if not camino:
+            self.raiz = hijo
+            return
+        if camino[-1].izquierdo is nodo:
+            camino[-1].izquierdo = hijo
+        else:
+            camino[-1].derecho = hijo
         
-        # Balancear después de eliminar
-        return self.balancear(nodo)
+        # Balancear después de eliminar, de abajo arriba
+        self._retrazar(camino)
     
     def _minimo_nodo(self, nodo):
         """Encuentra el nodo con la clave mínima"""
@@ -349,19 +395,104 @@ class ArbolAVL:
         if self.arbol_vacio():
             return None
         
-        # Encontrar el nodo más a la izquierda
+        # Bajar por la izquierda guardando el camino
+        camino = []
         nodo_min = self.raiz
         while nodo_min.izquierdo is not None:
+            camino.append(nodo_min)
             nodo_min = nodo_min.izquierdo
         
-        # Guardar valor antes de eliminar
-        valor = nodo_min.valor
-        clave = nodo_min.clave
+        if self.verbose:
+            print(f"  [AVL] Eliminando {nodo_min.clave}")
         
-        # Eliminar ese nodo
-        self.eliminar(clave)
+        # El mínimo no tiene hijo izquierdo: su hijo derecho ocupa su lugar
+        if camino:
+            camino[-1].izquierdo = nodo_min.derecho
+            self._retrazar(camino)
+        else:
+            self.raiz = nodo_min.derecho
         
-        return valor
+        return nodo_min.valor
+
+
+class ArbolAVLInstrumentado(ArbolAVL):
+    """
+    ArbolAVL que cuenta sus rotaciones en un SearchStats.
+    Solo se usa cuando se piden estadísticas: el ArbolAVL normal no paga nada.
+    """
+    def __init__(self, stats, verbose=True):
+        super().__init__(verbose)
+        self.stats = stats
+    
+    def rotacion_derecha(self, z):
+        self.stats.rotations += 1
+        return super().rotacion_derecha(z)
+    
+    def rotacion_izquierda(self, z):
+        self.stats.rotations += 1
+        return super().rotacion_izquierda(z)
+
+
+class SearchStats:
+    """
+    Estadísticas de una ejecución de Dijkstra (mismos campos que SearchStats
+    de 8_DEFINITIVO++/Van_Dijk, para poder comparar implementaciones).
+    
+    - settled: almacenes fijados
+    - relaxed: rutas examinadas; improved: las que bajan una distancia
+    - stale: extracciones obsoletas (aquí siempre 0: se elimina la clave antigua)
+    - peak_queue: tamaño máximo del AVL; rotations: rotaciones del AVL
+    - phases: segundos por fase
+    
+    hook(evento, stats, dato) recibe "settle" con cada almacén fijado y
+    "phase" al cerrar cada fase (exportador de métricas, profiler por muestreo...).
+    """
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.settled = 0
+        self.relaxed = 0
+        self.improved = 0
+        self.stale = 0
+        self.queue_size = 0
+        self.peak_queue = 0
+        self.rotations = 0
+        self.phases = {}
+        self._phase = None
+        self._phase_start = 0.0
+    
+    def push(self):
+        self.queue_size += 1
+        if self.queue_size > self.peak_queue:
+            self.peak_queue = self.queue_size
+    
+    def pop(self):
+        self.queue_size -= 1
+    
+    def settle(self, nodo):
+        self.settled += 1
+        if self.hook is not None:
+            self.hook("settle", self, nodo)
+    
+    def phase(self, nombre):
+        """Cierra la fase en curso y abre la siguiente (None solo cierra)"""
+        ahora = time.perf_counter()
+        if self._phase is not None:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + ahora - self._phase_start
+            if self.hook is not None:
+                self.hook("phase", self, self._phase)
+        self._phase = nombre
+        self._phase_start = ahora
+    
+    def as_dict(self):
+        return {
+            "settled": self.settled,
+            "relaxed": self.relaxed,
+            "improved": self.improved,
+            "stale": self.stale,
+            "peak_queue": self.peak_queue,
+            "rotations": self.rotations,
+            "phases": dict(self.phases),
+        }
 
 
 # ===================================================================================
@@ -410,13 +541,15 @@ class Grafo:
         """Devuelve lista de todos los almacenes"""
         return list(self.nodos.values())
     
-    def reiniciar_para_dijkstra(self):
+    def reiniciar_para_dijkstra(self, verbose=True):
         """Reinicia todos los almacenes para una nueva ejecución de Dijkstra"""
-        print("[Grafo] Reiniciando almacenes para Dijkstra...")
+        if verbose:
+            print("[Grafo] Reiniciando almacenes para Dijkstra...")
         for almacen in self.nodos.values():
             almacen.visitado = False
             almacen.distancia = float('inf')
             almacen.predecesor = None
+            almacen.almacen_asignado = None
     
     def __str__(self):
         resultado = "\n=== RED DE ALMACENES ===\n"
@@ -448,7 +581,7 @@ class DijkstraConAVL:
         self.grafo = grafo
         self.resultados = {}  # {id_almacen: {'distancia': X, 'camino': [...]}}
     
-    def ejecutar(self, origen_id):
+    def ejecutar(self, origen_id, stats=None, verbose=True):
         """
         Ejecuta Dijkstra desde el almacén origen.
         
@@ -462,86 +595,228 @@ class DijkstraConAVL:
               - Calcular nueva distancia
               - Si es menor, actualizar y reinsertar en AVL
         4. Reconstruir caminos usando predecesores
+        
+        stats: SearchStats opcional (sin él no se cuenta nada).
+        verbose: False silencia la traza de cada iteración.
         """
-        print("\n" + "="*70)
-        print(f"EJECUTANDO DIJKSTRA DESDE ALMACÉN {origen_id}")
-        print("="*70)
+        if verbose:
+            print("\n" + "="*70)
+            print(f"EJECUTANDO DIJKSTRA DESDE ALMACÉN {origen_id}")
+            print("="*70)
+        
+        # Paso 1 y 2: inicializar y crear el AVL
+        if stats is not None:
+            stats.phase("inicializacion")
+        avl = self._inicializar([origen_id], stats, verbose)
+        if avl is None:
+            if stats is not None:
+                stats.phase(None)
+            return None
+        
+        # Paso 3: Procesar almacenes
+        if stats is not None:
+            stats.phase("busqueda")
+        self._procesar(avl, stats, verbose)
         
-        # Paso 1: Inicializar
-        self.grafo.reiniciar_para_dijkstra()
+        # Paso 4: Construir resultados
+        if stats is not None:
+            stats.phase("resultados")
+        if verbose:
+            print("[Dijkstra] Construyendo resultados finales...")
+        self._construir_resultados()
+        if stats is not None:
+            stats.phase(None)
         
-        if origen_id not in self.grafo.nodos:
-            print(f"ERROR: Almacén {origen_id} no existe")
+        return self.resultados
+    
+    def ejecutar_multiorigen(self, origenes_ids, stats=None, verbose=True):
+        """
+        Ejecuta Dijkstra desde VARIOS almacenes origen a la vez.
+        
+        Equivale a añadir un súper-origen ficticio unido a cada origen
+        con distancia 0, así que basta UNA sola pasada:
+        1. Inicializar: distancia[origen] = 0 para todos los orígenes
+        2. Cada origen es su propio almacen_asignado
+        3. Dijkstra normal, pero al relajar una ruta el vecino hereda
+           el almacen_asignado del nodo actual
+        
+        Resultado: partición tipo Voronoi del grafo (cada almacén queda
+        asignado al origen más cercano) más las distancias.
+        
+        stats y verbose: igual que en ejecutar().
+        
+        Devuelve: {'distancias': {id: km},
+                   'asignacion': {id: origen o None},
+                   'particion': {origen: [ids asignados]}}
+        """
+        origenes_ids = list(origenes_ids)
+        if verbose:
+            print("\n" + "="*70)
+            print(f"EJECUTANDO DIJKSTRA MULTIORIGEN DESDE {origenes_ids}")
+            print("="*70)
+        
+        # Paso 1 y 2: todos los orígenes a distancia 0
+        if stats is not None:
+            stats.phase("inicializacion")
+        avl = self._inicializar(origenes_ids, stats, verbose)
+        if avl is None:
+            if stats is not None:
+                stats.phase(None)
             return None
         
-        almacen_origen = self.grafo.obtener_almacen(origen_id)
-        almacen_origen.distancia = 0
+        # Paso 3: Dijkstra propagando el origen asignado
+        if stats is not None:
+            stats.phase("busqueda")
+        self._procesar(avl, stats, verbose)
         
-        # Paso 2: Crear AVL con todos los almacenes
-        print("\n[Dijkstra] Inicializando AVL con todos los almacenes...")
-        avl = ArbolAVL()
+        # Paso 4: Construir resultados y partición
+        if stats is not None:
+            stats.phase("resultados")
+        self._construir_resultados()
+        
+        particion = {origen_id: [] for origen_id in origenes_ids}
+        asignacion = {}
+        for id_almacen, almacen in self.grafo.nodos.items():
+            asignacion[id_almacen] = almacen.almacen_asignado
+            self.resultados[id_almacen]['almacen_asignado'] = almacen.almacen_asignado
+            if almacen.almacen_asignado is not None:
+                particion[almacen.almacen_asignado].append(id_almacen)
+        if stats is not None:
+            stats.phase(None)
+        
+        return {
+            'distancias': {i: r['distancia'] for i, r in self.resultados.items()},
+            'asignacion': asignacion,
+            'particion': particion
+        }
+    
+    def _inicializar(self, origenes_ids, stats, verbose):
+        """
+        Pone los orígenes a distancia 0 (cada uno es su propio almacen_asignado)
+        y crea el AVL con todos los almacenes. None si algún origen no existe.
+        """
+        self.grafo.reiniciar_para_dijkstra(verbose)
+        
+        for origen_id in origenes_ids:
+            if origen_id not in self.grafo.nodos:
+                print(f"ERROR: Almacén {origen_id} no existe")
+                return None
+        
+        for origen_id in origenes_ids:
+            almacen_origen = self.grafo.obtener_almacen(origen_id)
+            almacen_origen.distancia = 0
+            almacen_origen.almacen_asignado = origen_id
+        
+        if verbose:
+            print("\n[Dijkstra] Inicializando AVL con todos los almacenes...")
+        avl = ArbolAVL(verbose) if stats is None else ArbolAVLInstrumentado(stats, verbose)
         
         for almacen in self.grafo.obtener_todos_almacenes():
             # Clave = (distancia, id) para mantener orden y unicidad
-            clave = (almacen.distancia, almacen.id)
-            avl.insertar(clave, almacen)
+            avl.insertar((almacen.distancia, almacen.id), almacen)
+        if stats is not None:
+            for _ in range(len(self.grafo.nodos)):
+                stats.push()
         
-        print(f"[Dijkstra] AVL inicializado con {len(self.grafo.nodos)} almacenes")
+        if verbose:
+            print(f"[Dijkstra] AVL inicializado con {len(self.grafo.nodos)} almacenes")
+        return avl
+    
+    def _procesar(self, avl, stats, verbose):
+        """
+        Paso 3: extraer el almacén más cercano y relajar sus rutas hasta
+        vaciar el AVL. El vecino mejorado hereda el almacen_asignado.
         
-        # Paso 3: Procesar almacenes
-        print("\n[Dijkstra] Procesando almacenes...\n")
+        Con traza o estadísticas se usa _procesar_detallado: la decisión se
+        toma una vez aquí, no en cada iteración del bucle.
+        """
+        if stats is not None or verbose:
+            self._procesar_detallado(avl, stats if stats is not None else SearchStats(), verbose)
+            return
+        
+        while not avl.arbol_vacio():
+            almacen_actual = avl.extraer_minimo()
+            
+            if almacen_actual is None or almacen_actual.distancia == float('inf'):
+                break
+            
+            almacen_actual.visitado = True
+            
+            for vecino in almacen_actual.obtener_rutas():
+                if vecino.visitado:
+                    continue
+                
+                nueva_distancia = (almacen_actual.distancia
+                                   + almacen_actual.obtener_distancia_a(vecino))
+                
+                if nueva_distancia < vecino.distancia:
+                    avl.eliminar((vecino.distancia, vecino.id))
+                    vecino.distancia = nueva_distancia
+                    vecino.predecesor = almacen_actual
+                    vecino.almacen_asignado = almacen_actual.almacen_asignado
+                    avl.insertar((vecino.distancia, vecino.id), vecino)
+    
+    def _procesar_detallado(self, avl, stats, verbose):
+        """Mismo bucle que _procesar, con traza (verbose) y contadores (stats)"""
+        if verbose:
+            print("\n[Dijkstra] Procesando almacenes...\n")
         iteracion = 0
         
         while not avl.arbol_vacio():
             iteracion += 1
-            print(f"--- Iteración {iteracion} ---")
+            if verbose:
+                print(f"--- Iteración {iteracion} ---")
             
             # Extraer almacén con menor distancia
             almacen_actual = avl.extraer_minimo()
+            stats.pop()
             
             if almacen_actual is None or almacen_actual.distancia == float('inf'):
-                print("  No hay más almacenes alcanzables")
+                if verbose:
+                    print("  No hay más almacenes alcanzables")
                 break
             
-            print(f"  Procesando: {almacen_actual.id} "
-                  f"(distancia actual: {almacen_actual.distancia})")
+            if verbose:
+                print(f"  Procesando: {almacen_actual.id} "
+                      f"(distancia actual: {almacen_actual.distancia})")
             
             # Marcar como visitado
             almacen_actual.visitado = True
+            stats.settle(almacen_actual)
             
             # Explorar rutas vecinas
             for vecino in almacen_actual.obtener_rutas():
                 if not vecino.visitado:
                     distancia_ruta = almacen_actual.obtener_distancia_a(vecino)
                     nueva_distancia = almacen_actual.distancia + distancia_ruta
+                    stats.relaxed += 1
                     
-                    print(f"    Vecino {vecino.id}: "
-                          f"dist_actual={vecino.distancia}, "
-                          f"nueva_dist={nueva_distancia}")
+                    if verbose:
+                        print(f"    Vecino {vecino.id}: "
+                              f"dist_actual={vecino.distancia}, "
+                              f"nueva_dist={nueva_distancia}")
                     
                     # Si encontramos un camino más corto
                     if nueva_distancia < vecino.distancia:
-                        print(f"      ¡Mejor camino encontrado! Actualizando...")
+                        if verbose:
+                            print(f"      ¡Mejor camino encontrado! Actualizando...")
                         
                         # Eliminar del AVL con distancia antigua
                         clave_antigua = (vecino.distancia, vecino.id)
                         avl.eliminar(clave_antigua)
                         
-                        # Actualizar distancia y predecesor
+                        # Actualizar distancia, predecesor y origen asignado
                         vecino.distancia = nueva_distancia
                         vecino.predecesor = almacen_actual
+                        vecino.almacen_asignado = almacen_actual.almacen_asignado
                         
                         # Reinsertar con nueva distancia
                         clave_nueva = (vecino.distancia, vecino.id)
                         avl.insertar(clave_nueva, vecino)
+                        stats.improved += 1
             
-            print()
-        
-        # Paso 4: Construir resultados
-        print("[Dijkstra] Construyendo resultados finales...")
-        self._construir_resultados()
-        
-        return self.resultados
+            if verbose:
+                print()
     
     def _construir_resultados(self):
         """Construye la tabla de resultados con distancias y caminos"""
@@ -567,9 +842,10 @@ class DijkstraConAVL:
         actual = almacen_destino
         
         while actual is not None:
-            camino.insert(0, actual.id)  # Insertar al principio
+            camino.append(actual.id)  # append es O(1); insert(0, ...) haría O(L²)
             actual = actual.predecesor
         
+        camino.reverse()
         return camino
     
     def obtener_camino_a(self, destino_id):
@@ -667,6 +943,26 @@ def main():
             num_paradas = len(info['camino']) - 1
             print(f"  Número de paradas intermedias: {num_paradas}")
     
+    # =============== ESTADÍSTICAS SIN TRAZA ===============
+    print("\nESTADÍSTICAS DE LA BÚSQUEDA (verbose=False):")
+    print("-"*70)
+    
+    stats = SearchStats()
+    dijkstra.ejecutar('A', stats=stats, verbose=False)
+    for campo, valor in stats.as_dict().items():
+        print(f"  {campo}: {valor}")
+    
+    # =============== ALMACÉN MÁS CERCANO (MULTIORIGEN) ===============
+    print("\nASIGNACIÓN AL ALMACÉN ORIGEN MÁS CERCANO (A y D):")
+    print("-"*70)
+    
+    reparto = dijkstra.ejecutar_multiorigen(['A', 'D'], verbose=False)
+    for origen, asignados in reparto['particion'].items():
+        print(f"  Origen {origen}: {asignados}")
+    for id_almacen in sorted(reparto['distancias']):
+        print(f"  {id_almacen}: {reparto['distancias'][id_almacen]} km "
+              f"desde {reparto['asignacion'][id_almacen]}")
+    
     print("\n" + "="*70)
     print("EJERCICIO COMPLETADO")
     print("="*70 + "\n")
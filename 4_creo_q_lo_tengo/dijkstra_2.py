@@ -1,3 +1,6 @@
+import time
+
+
 # -------------------------------------------------------
 # TDA: Nodo del AVL
 # -------------------------------------------------------
@@ -146,6 +149,77 @@ class AVLTree:
         return root
 
 
+# -------------------------------------------------------
+# TDA: AVL que cuenta rotaciones (solo con estadísticas)
+# -------------------------------------------------------
+class InstrumentedAVLTree(AVLTree):
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+
+    def rotate_right(self, y):
+        self.stats.rotations += 1
+        return super().rotate_right(y)
+
+    def rotate_left(self, x):
+        self.stats.rotations += 1
+        return super().rotate_left(x)
+
+
+# -------------------------------------------------------
+# TDA: Estadísticas de búsqueda
+# (mismos campos que SearchStats de 8_DEFINITIVO++/Van_Dijk)
+# -------------------------------------------------------
+class SearchStats:
+    # hook(evento, stats, dato): "settle" con cada nodo fijado, "phase" al cerrar una fase
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.settled = 0
+        self.relaxed = 0      # aristas examinadas
+        self.improved = 0     # relajaciones que bajan una distancia
+        self.stale = 0        # extracciones obsoletas descartadas
+        self.queue_size = 0
+        self.peak_queue = 0
+        self.rotations = 0
+        self.phases = {}      # fase -> segundos
+        self._phase = None
+        self._phase_start = 0.0
+
+    def push(self):
+        self.queue_size += 1
+        if self.queue_size > self.peak_queue:
+            self.peak_queue = self.queue_size
+
+    def pop(self):
+        self.queue_size -= 1
+
+    def settle(self, node):
+        self.settled += 1
+        if self.hook is not None:
+            self.hook("settle", self, node)
+
+    def phase(self, name):
+        # Cierra la fase en curso y abre la siguiente; None solo cierra
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_start
+            if self.hook is not None:
+                self.hook("phase", self, self._phase)
+        self._phase = name
+        self._phase_start = now
+
+    def as_dict(self):
+        return {
+            "settled": self.settled,
+            "relaxed": self.relaxed,
+            "improved": self.improved,
+            "stale": self.stale,
+            "peak_queue": self.peak_queue,
+            "rotations": self.rotations,
+            "phases": dict(self.phases),
+        }
+
+
 # -------------------------------------------------------
 # TDA: Grafo (para Dijkstra)
 # -------------------------------------------------------
@@ -194,16 +268,49 @@ class DijkstraAVL:
     # -------------------------------------------
     # Algoritmo de Dijkstra
     # -------------------------------------------
-    def run(self, start):
+    # stats: SearchStats opcional; se decide una vez y el bucle normal no cuenta nada
+    def run(self, start, stats=None):
+        if stats is not None:
+            return self._run_instrumented(start, stats)
+
+        self.dist[start] = 0
+        self.push(0, start)
+
+        while self.heap_root is not None:
+            current_dist, current_name = self.pop()
+            current = self.graph.nodes[current_name]
+
+            if current_dist > self.dist[current_name]:
+                continue
+
+            for neighbor, weight in current.edges:
+                new_dist = current_dist + weight
+                if new_dist < self.dist[neighbor.name]:
+                    self.dist[neighbor.name] = new_dist
+                    self.parent[neighbor.name] = current_name
+                    self.push(new_dist, neighbor.name)
+
+        return self.dist, self.parent
+
+    # mismo bucle que run, contando en stats (y rotaciones con el AVL instrumentado)
+    def _run_instrumented(self, start, stats):
+        self.heap = InstrumentedAVLTree(stats)
+        stats.phase("search")
+
         self.dist[start] = 0
         self.push(0, start)
+        stats.push()
 
         while self.heap_root is not None:
             current_dist, current_name = self.pop()
             current = self.graph.nodes[current_name]
+            stats.pop()
 
             if current_dist > self.dist[current_name]:
+                stats.stale += 1
                 continue
+            stats.settle(current_name)
+            stats.relaxed += len(current.edges)
 
             for neighbor, weight in current.edges:
                 new_dist = current_dist + weight
@@ -211,7 +318,11 @@ class DijkstraAVL:
                     self.dist[neighbor.name] = new_dist
                     self.parent[neighbor.name] = current_name
                     self.push(new_dist, neighbor.name)
+                    stats.improved += 1
+                    stats.push()
 
+        stats.phase(None)
+        self.heap = AVLTree()
         return self.dist, self.parent
 
     # reconstrucción del camino
@@ -248,3 +359,7 @@ if __name__ == "__main__":
 
     print("\nCamino de A a E:")
     print(d.get_path("E"))
+
+    stats = SearchStats()
+    DijkstraAVL(g).run("A", stats=stats)
+    print("\nEstadísticas:", stats.as_dict())
@@ -66,54 +66,79 @@ class ArbolAVL:
         
         return y
     
-    def insertar(self, nodo, vertice):
-        """Inserta un vértice en el árbol AVL"""
-        # Inserción BST estándar
-        if not nodo:
-            return NodoAVL(vertice)
-        
-        if vertice < nodo.vertice:
-            nodo.izquierdo = self.insertar(nodo.izquierdo, vertice)
-        elif vertice > nodo.vertice:
-            nodo.derecho = self.insertar(nodo.derecho, vertice)
-        else:
-            return nodo  # Vértice duplicado, no insertar
-        
-        # Actualizar altura
-        self.actualizar_altura(nodo)
-        
-        # Obtener balance
+    def balancear(self, nodo):
+        """Aplica la rotación que corresponda y retorna la raíz del subárbol"""
         balance = self.obtener_balance(nodo)
         
-        # Casos de desbalance
-        # Caso Izquierda-Izquierda
-        if balance > 1 and vertice < nodo.izquierdo.vertice:
+        # Casos Izquierda-Izquierda e Izquierda-Derecha
+        if balance > 1:
+            if self.obtener_balance(nodo.izquierdo) < 0:
+                nodo.izquierdo = self.rotar_izquierda(nodo.izquierdo)
             return self.rotar_derecha(nodo)
         
-        # Caso Derecha-Derecha
-        if balance < -1 and vertice > nodo.derecho.vertice:
+        # Casos Derecha-Derecha y Derecha-Izquierda
+        if balance < -1:
+            if self.obtener_balance(nodo.derecho) > 0:
+                nodo.derecho = self.rotar_derecha(nodo.derecho)
             return self.rotar_izquierda(nodo)
         
-        # Caso Izquierda-Derecha
-        if balance > 1 and vertice > nodo.izquierdo.vertice:
-            nodo.izquierdo = self.rotar_izquierda(nodo.izquierdo)
-            return self.rotar_derecha(nodo)
+        return nodo
+    
+    def retrazar(self, raiz, camino):
+        """Rebalancea el camino de abajo arriba y retorna la nueva raíz.
+        Se detiene en cuanto un subárbol conserva su altura."""
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            altura_previa = nodo.altura
+            self.actualizar_altura(nodo)
+            subarbol = self.balancear(nodo)
+            
+            # Colgar la nueva raíz del subárbol donde estaba nodo
+            if subarbol is not nodo:
+                if i == 0:
+                    raiz = subarbol
+                elif camino[i - 1].izquierdo is nodo:
+                    camino[i - 1].izquierdo = subarbol
+                else:
+                    camino[i - 1].derecho = subarbol
+            
+            if subarbol.altura == altura_previa:
+                break
+        return raiz
+    
+    def insertar(self, nodo, vertice):
+        """Inserta un vértice en el árbol AVL (sin recursión)"""
+        if not nodo:
+            return NodoAVL(vertice)
         
-        # Caso Derecha-Izquierda
-        if balance < -1 and vertice < nodo.derecho.vertice:
-            nodo.derecho = self.rotar_derecha(nodo.derecho)
-            return self.rotar_izquierda(nodo)
+        # Inserción BST estándar guardando el camino
+        camino = []
+        actual = nodo
+        while actual:
+            if vertice == actual.vertice:
+                return nodo  # Vértice duplicado, no insertar
+            camino.append(actual)
+            if vertice < actual.vertice:
+                actual = actual.izquierdo
+            else:
+                actual = actual.derecho
+        
+        padre = camino[-1]
+        if vertice < padre.vertice:
+            padre.izquierdo = NodoAVL(vertice)
+        else:
+            padre.derecho = NodoAVL(vertice)
         
-        return nodo
+        return self.retrazar(nodo, camino)
     
     def buscar(self, nodo, vertice):
         """Busca un vértice en el árbol AVL"""
-        if not nodo or nodo.vertice == vertice:
-            return nodo
-        
-        if vertice < nodo.vertice:
-            return self.buscar(nodo.izquierdo, vertice)
-        return self.buscar(nodo.derecho, vertice)
+        while nodo and nodo.vertice != vertice:
+            if vertice < nodo.vertice:
+                nodo = nodo.izquierdo
+            else:
+                nodo = nodo.derecho
+        return nodo
     
     def obtener_minimo(self, nodo):
         """Obtiene el nodo con valor mínimo"""
@@ -123,60 +148,53 @@ class ArbolAVL:
         return actual
     
     def eliminar(self, nodo, vertice):
-        """Elimina un vértice del árbol AVL"""
-        if not nodo:
+        """Elimina un vértice del árbol AVL (sin recursión)"""
+        # Búsqueda del nodo a eliminar guardando el camino
+        camino = []
+        actual = nodo
+        while actual and actual.vertice != vertice:
+            camino.append(actual)
+            if vertice < actual.vertice:
+                actual = actual.izquierdo
+            else:
+                actual = actual.derecho
+        
+        if not actual:
             return nodo
         
-        # Búsqueda del nodo a eliminar
-        if vertice < nodo.vertice:
-            nodo.izquierdo = self.eliminar(nodo.izquierdo, vertice)
-        elif vertice > nodo.vertice:
-            nodo.derecho = self.eliminar(nodo.derecho, vertice)
+        # Nodo con dos hijos: copiar el sucesor y eliminar el sucesor
+        if actual.izquierdo and actual.derecho:
+            camino.append(actual)
+            sucesor = actual.derecho
+            while sucesor.izquierdo:
+                camino.append(sucesor)
+                sucesor = sucesor.izquierdo
+            actual.vertice = sucesor.vertice
+            actual.adyacentes = sucesor.adyacentes
+            actual = sucesor
+        
+        # Ahora actual tiene como mucho un hijo, que ocupa su lugar
+        hijo = actual.izquierdo or actual.derecho
+        if not camino:
+            return hijo
+        padre = camino[-1]
+        if padre.izquierdo is actual:
+            padre.izquierdo = hijo
         else:
-            # Nodo encontrado
-            if not nodo.izquierdo:
-                return nodo.derecho
-            elif not nodo.derecho:
-                return nodo.izquierdo
-            
-            # Nodo con dos hijos
-            temp = self.obtener_minimo(nodo.derecho)
-            nodo.vertice = temp.vertice
-            nodo.adyacentes = temp.adyacentes
-            nodo.derecho = self.eliminar(nodo.derecho, temp.vertice)
-        
-        if not nodo:
-            return nodo
-        
-        # Actualizar altura
-        self.actualizar_altura(nodo)
-        
-        # Balancear
-        balance = self.obtener_balance(nodo)
+            padre.derecho = hijo
         
-        # Casos de desbalance
-        if balance > 1 and self.obtener_balance(nodo.izquierdo) >= 0:
-            return self.rotar_derecha(nodo)
-        
-        if balance > 1 and self.obtener_balance(nodo.izquierdo) < 0:
-            nodo.izquierdo = self.rotar_izquierda(nodo.izquierdo)
-            return self.rotar_derecha(nodo)
-        
-        if balance < -1 and self.obtener_balance(nodo.derecho) <= 0:
-            return self.rotar_izquierda(nodo)
-        
-        if balance < -1 and self.obtener_balance(nodo.derecho) > 0:
-            nodo.derecho = self.rotar_derecha(nodo.derecho)
-            return self.rotar_izquierda(nodo)
-        
-        return nodo
+        return self.retrazar(nodo, camino)
     
     def inorden(self, nodo, resultado):
-        """Recorrido inorden del árbol"""
-        if nodo:
-            self.inorden(nodo.izquierdo, resultado)
+        """Recorrido inorden del árbol con una pila explícita"""
+        pila = []
+        while pila or nodo:
+            while nodo:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            nodo = pila.pop()
             resultado.append(nodo.vertice)
-            self.inorden(nodo.derecho, resultado)
+            nodo = nodo.derecho
 
 
 class Grafo:
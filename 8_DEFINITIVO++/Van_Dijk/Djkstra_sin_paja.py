@@ -1,3 +1,13 @@
+import heapq
+import struct
+import sys
+import threading
+import time
+from array import array
+from itertools import count
+from mmap import mmap as MemoryMap, ACCESS_READ
+
+
 # ===========================================================
 #                    TDA: GRAPH EDGE
 # ===========================================================
@@ -7,6 +17,7 @@ class GraphEdge:
         self.source = source
         self.destination = destination
         self.weight = weight
+        self.reverse_position = None  # posición en el índice inverso del grafo, si existe
 
 
 # ===========================================================
@@ -14,14 +25,73 @@ class GraphEdge:
 # ===========================================================
 
 class GraphNode:
-    def __init__(self, name):
+    def __init__(self, name, coords=None):
         self.name = name
+        self.id = None  # posición en Graph.node_list, la asigna el grafo
+        self.coords = coords  # (x, y) o (lat, lon), opcional para A*
         self.edges = []
+        self.edge_index = None  # destino -> posición en edges (lista solo si hay paralelas)
         self.distance = float('inf')
         self.previous = None
 
     def add_edge(self, destination, weight):
-        self.edges.append(GraphEdge(self, destination, weight))
+        return self.append_edge(GraphEdge(self, destination, weight))
+
+    def append_edge(self, edge):
+        if self.edge_index is not None:
+            self._index_edge(edge.destination, len(self.edges))
+        self.edges.append(edge)
+        return edge
+
+    def _index_edge(self, destination, pos):
+        positions = self.edge_index.get(destination)
+        if positions is None:
+            self.edge_index[destination] = pos
+        elif type(positions) is int:
+            self.edge_index[destination] = [positions, pos]
+        else:
+            positions.append(pos)
+
+    def _edge_index(self):
+        # Se construye con la primera búsqueda o borrado: los nodos que nunca
+        # se modifican no pagan un diccionario propio
+        if self.edge_index is None:
+            self.edge_index = {}
+            for pos, edge in enumerate(self.edges):
+                self._index_edge(edge.destination, pos)
+        return self.edge_index
+
+    def find_edges(self, destination):
+        positions = self._edge_index().get(destination)
+        if positions is None:
+            return []
+        if type(positions) is int:
+            return [self.edges[positions]]
+        return [self.edges[i] for i in positions]
+
+    def remove_edge(self, destination):
+        # Quita una sola arista hacia destination (Graph.remove_edge las quita todas)
+        # O(1): la última arista ocupa el hueco (swap-pop)
+        positions = self._edge_index().get(destination)
+        if positions is None:
+            return None
+        if type(positions) is int:
+            pos = positions
+            del self.edge_index[destination]
+        else:
+            pos = positions.pop()
+            if len(positions) == 1:
+                self.edge_index[destination] = positions[0]
+        removed = self.edges[pos]
+        last = self.edges.pop()
+        if last is not removed:
+            self.edges[pos] = last
+            moved = self.edge_index[last.destination]
+            if type(moved) is int:
+                self.edge_index[last.destination] = pos
+            else:
+                moved[moved.index(len(self.edges))] = pos
+        return removed
 
     def reset(self):
         self.distance = float('inf')
@@ -35,24 +105,347 @@ class GraphNode:
 class Graph:
     def __init__(self):
         self.nodes = {}
+        self.node_list = []  # id -> GraphNode
+        self._reverse = None  # índice inverso, se construye bajo demanda
+        self.integer_weights = True  # todos los pesos son enteros >= 0
+        self.max_weight = 0
+        self.version = 0  # cambia con cada modificación de la topología o los pesos
 
-    def add_node(self, name):
+    def add_node(self, name, coords=None):
         if name not in self.nodes:
-            self.nodes[name] = GraphNode(name)
+            node = GraphNode(name, coords)
+            node.id = len(self.node_list)
+            self.nodes[name] = node
+            self.node_list.append(node)
+            if self._reverse is not None:
+                self._reverse[node] = []
+            self.version += 1
+        elif coords is not None:
+            self.nodes[name].coords = coords
         return self.nodes[name]
 
     def add_edge(self, source_name, destination_name, weight):
         source = self.add_node(source_name)
         destination = self.add_node(destination_name)
-        source.add_edge(destination, weight)
+        edge = source.add_edge(destination, weight)
+        if self._reverse is not None:
+            incoming = self._reverse[destination]
+            edge.reverse_position = len(incoming)
+            incoming.append(edge)
+        self._track_weight(weight)
+        self.version += 1
+
+    def remove_edge(self, source_name, destination_name):
+        # Quita todas las aristas source -> destination, como set_weight las cambia
+        # todas; devuelve la lista de aristas quitadas
+        source = self.get_node(source_name)
+        destination = self.get_node(destination_name)
+        removed = []
+        while source and destination:
+            edge = source.remove_edge(destination)
+            if edge is None:
+                break
+            removed.append(edge)
+            if self._reverse is not None:
+                # O(1) también en el índice inverso: swap-pop con la posición guardada
+                incoming = self._reverse[destination]
+                last = incoming.pop()
+                if last is not edge:
+                    incoming[edge.reverse_position] = last
+                    last.reverse_position = edge.reverse_position
+                edge.reverse_position = None
+        if not removed:
+            raise ValueError(f"Arista '{source_name}' -> '{destination_name}' no existe")
+        self.version += 1
+        return removed
+
+    def set_weight(self, source_name, destination_name, weight):
+        # Cambia todas las aristas source -> destination; devuelve el peso mínimo anterior
+        source = self.get_node(source_name)
+        destination = self.get_node(destination_name)
+        edges = source.find_edges(destination) if source and destination else []
+        if not edges:
+            raise ValueError(f"Arista '{source_name}' -> '{destination_name}' no existe")
+        old = min(edge.weight for edge in edges)
+        for edge in edges:
+            edge.weight = weight
+        self._track_weight(weight)
+        self.version += 1
+        return old
+
+    def _track_weight(self, weight):
+        if not (isinstance(weight, int) and weight >= 0):
+            self.integer_weights = False
+        elif weight > self.max_weight:
+            self.max_weight = weight
 
     def get_node(self, name):
         return self.nodes.get(name)
 
+    def reverse_edges(self, node):
+        if self._reverse is None:
+            # Se publica ya completo: una consulta concurrente nunca ve listas a medias
+            reverse = {n: [] for n in self.nodes.values()}
+            for n in self.nodes.values():
+                for edge in n.edges:
+                    incoming = reverse[edge.destination]
+                    edge.reverse_position = len(incoming)
+                    incoming.append(edge)
+            self._reverse = reverse
+        return self._reverse[node]
+
     def reset_distances(self):
         for node in self.nodes.values():
             node.reset()
 
+    def freeze(self):
+        return CSRGraph.from_graph(self)
+
+    def save(self, path):
+        # Se guarda la vista CSR: se relee con CSRGraph.load (no hay Graph.load,
+        # no se reconstruyen GraphNode/GraphEdge)
+        self.freeze().save(path)
+
+
+# ===========================================================
+#              TDA: CSR GRAPH (VISTA INMUTABLE)
+# ===========================================================
+
+class CSRGraph:
+    # Aristas de u en targets/weights[offsets[u]:offsets[u + 1]]
+    __slots__ = ("names", "ids", "offsets", "targets", "weights", "path", "_weight_profile")
+
+    # Formato binario (little-endian, secciones alineadas a 8 bytes):
+    #   cabecera  MAGIC, versión, tipo de nombre, nodos, aristas, bytes de nombres
+    #   offsets   int64[nodos + 1]
+    #   weights   float64[aristas]
+    #   targets   int32[aristas] (+ relleno)
+    #   nombres   int64[nodos + 1] desplazamientos + UTF-8, o int64[nodos]
+    # En máquinas big-endian se invierten los bytes al guardar y al cargar
+    # (la carga copia en vez de mapear).
+    MAGIC = b"GRPH"
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<4sHHqqq")
+    NAMES_STR, NAMES_INT = 0, 1
+
+    def __init__(self, names, offsets, targets, weights, path=None, weight_profile=None):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.path = path  # fichero mapeado en memoria, si lo hay
+        self._weight_profile = weight_profile  # (pesos enteros >= 0, peso máximo)
+
+    def __getstate__(self):
+        # Mapeado: basta el fichero, cada proceso lo vuelve a mapear (page cache)
+        if self.path is not None:
+            return {"path": self.path, "weight_profile": self._weight_profile}
+        return {"names": self.names, "offsets": self.offsets,
+                "targets": self.targets, "weights": self.weights,
+                "weight_profile": self._weight_profile}
+
+    def __setstate__(self, state):
+        if "names" not in state:
+            view = CSRGraph.load(state["path"], mmap=True)
+            state = {"names": view.names, "offsets": view.offsets, "targets": view.targets,
+                     "weights": view.weights, "path": view.path,
+                     "weight_profile": state.get("weight_profile")}
+        self.__init__(state["names"], state["offsets"], state["targets"], state["weights"],
+                      state.get("path"), state.get("weight_profile"))
+
+    def weight_profile(self):
+        # (todos los pesos enteros >= 0, peso máximo) para elegir la cola.
+        # Un solo recorrido por grafo, no uno por cada motor que se construye
+        if self._weight_profile is None:
+            integer_weights = all(w >= 0 and w.is_integer() for w in self.weights)
+            max_weight = int(max(self.weights, default=0)) if integer_weights else 0
+            self._weight_profile = (integer_weights, max_weight)
+        return self._weight_profile
+
+    @classmethod
+    def from_graph(cls, graph):
+        names = list(graph.nodes)
+        ids = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('d')
+        for node in graph.nodes.values():
+            for edge in node.edges:
+                targets.append(ids[edge.destination.name])
+                weights.append(edge.weight)
+            offsets.append(len(targets))
+        # Graph ya lleva la cuenta de sus pesos al añadirlos
+        return cls(names, offsets, targets, weights,
+                   weight_profile=(graph.integer_weights, graph.max_weight))
+
+    @classmethod
+    def from_edges(cls, names, sources, targets, weights, dedupe=None):
+        # Construcción en bloque por conteo (estable: respeta el orden de entrada)
+        # dedupe: None conserva aristas paralelas; "min", "sum" o "last" las funde
+        if dedupe not in (None, "min", "sum", "last"):
+            raise ValueError(f"Política de duplicados '{dedupe}' desconocida")
+        n, m = len(names), len(sources)
+        offsets = array('q', [0]) * (n + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        cursor = array('q', offsets)
+        out_targets = array('i', [0]) * m
+        out_weights = array('d', [0.0]) * m
+        for u, v, w in zip(sources, targets, weights):
+            pos = cursor[u]
+            out_targets[pos] = v
+            out_weights[pos] = w
+            cursor[u] = pos + 1
+
+        if dedupe is None:
+            return cls(names, offsets, out_targets, out_weights)
+
+        merged_offsets = array('q', [0]) * (n + 1)
+        write = 0
+        for u in range(n):
+            seen = {}
+            for i in range(offsets[u], offsets[u + 1]):
+                v, w = out_targets[i], out_weights[i]
+                j = seen.get(v)
+                if j is None:
+                    seen[v] = write
+                    out_targets[write] = v
+                    out_weights[write] = w
+                    write += 1
+                elif dedupe == "min":
+                    out_weights[j] = min(out_weights[j], w)
+                elif dedupe == "sum":
+                    out_weights[j] += w
+                else:
+                    out_weights[j] = w
+            merged_offsets[u + 1] = write
+        del out_targets[write:]
+        del out_weights[write:]
+        return cls(names, merged_offsets, out_targets, out_weights)
+
+    def num_nodes(self):
+        return len(self.names)
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def id_of(self, name):
+        return self.ids.get(name)
+
+    def name_of(self, node_id):
+        return self.names[node_id]
+
+    def neighbors(self, node_id):
+        for i in range(self.offsets[node_id], self.offsets[node_id + 1]):
+            yield self.targets[i], self.weights[i]
+
+    def reverse(self):
+        # Traspuesta por conteo: aristas entrantes de cada nodo
+        n = self.num_nodes()
+        counts = array('q', [0]) * (n + 1)
+        for v in self.targets:
+            counts[v + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+
+        offsets = array('q', counts)
+        targets = array('i', [0]) * len(self.targets)
+        weights = array('d', [0.0]) * len(self.weights)
+        for u in range(n):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                pos = counts[v]
+                targets[pos] = u
+                weights[pos] = self.weights[i]
+                counts[v] = pos + 1
+        return CSRGraph(self.names, offsets, targets, weights,
+                        weight_profile=self._weight_profile)
+
+    # -------------------- Persistencia binaria --------------------
+
+    @staticmethod
+    def _pad(size):
+        return -size % 8
+
+    @staticmethod
+    def _to_file(data, typecode):
+        data = array(typecode, data)
+        if sys.byteorder == "big":
+            data.byteswap()
+        return data.tobytes()
+
+    @staticmethod
+    def _from_file(buffer, typecode):
+        data = buffer.cast(typecode)
+        if sys.byteorder == "big":
+            data = array(typecode, data)
+            data.byteswap()
+        return data
+
+    def save(self, path):
+        n, m = self.num_nodes(), self.num_edges()
+        if all(isinstance(name, str) for name in self.names):
+            kind = self.NAMES_STR
+            encoded = [name.encode("utf-8") for name in self.names]
+            name_offsets = array('q', [0])
+            for raw in encoded:
+                name_offsets.append(name_offsets[-1] + len(raw))
+            names_blob = self._to_file(name_offsets, 'q') + b"".join(encoded)
+        elif all(isinstance(name, int) and not isinstance(name, bool) for name in self.names):
+            kind = self.NAMES_INT
+            names_blob = self._to_file(self.names, 'q')
+        else:
+            raise ValueError("Solo se pueden guardar nombres str o int")
+
+        targets = self._to_file(self.targets, 'i')
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, kind, n, m, len(names_blob)))
+            f.write(self._to_file(self.offsets, 'q'))
+            f.write(self._to_file(self.weights, 'd'))
+            f.write(targets + b"\0" * self._pad(len(targets)))
+            f.write(names_blob)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        with open(path, "rb") as f:
+            if mmap:
+                buffer = memoryview(MemoryMap(f.fileno(), 0, access=ACCESS_READ))
+            else:
+                buffer = memoryview(f.read())
+
+        magic, version, kind, n, m, names_size = cls.HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC:
+            raise ValueError(f"'{path}' no es un grafo binario")
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(f"Versión de grafo no soportada: {version}")
+
+        pos = cls.HEADER.size
+        sections = []
+        for typecode, length in (('q', n + 1), ('d', m), ('i', m)):
+            size = struct.calcsize(typecode) * length
+            sections.append(cls._from_file(buffer[pos:pos + size], typecode))
+            pos += size + cls._pad(size)
+        offsets, weights, targets = sections
+
+        if kind == cls.NAMES_INT:
+            names = cls._from_file(buffer[pos:pos + 8 * n], 'q').tolist()
+        else:
+            name_offsets = cls._from_file(buffer[pos:pos + 8 * (n + 1)], 'q')
+            blob = bytes(buffer[pos + 8 * (n + 1):pos + names_size])
+            names = [blob[name_offsets[i]:name_offsets[i + 1]].decode("utf-8")
+                     for i in range(n)]
+
+        if not mmap:
+            offsets, weights, targets = array('q', offsets), array('d', weights), array('i', targets)
+        return cls(names, offsets, targets, weights, path if mmap else None)
+
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.weights))
+
 
 # ===========================================================
 #                   TDA: AVL NODE
@@ -65,6 +458,7 @@ class AVLNode:
         self.height = 1
         self.left = None
         self.right = None
+        self.parent = None
 
 
 # ===========================================================
@@ -72,6 +466,7 @@ class AVLNode:
 # ===========================================================
 
 class AVLTree:
+    # insert devuelve el AVLNode como handle para decrease_key
     def __init__(self):
         self.root = None
 
@@ -84,10 +479,15 @@ class AVLTree:
     def _balance(self, node):
         return self._height(node.left) - self._height(node.right) if node else 0
 
+    # Las rotaciones fijan los parent del subárbol; el que llama enlaza la nueva raíz
     def _rotate_right(self, y):
         x = y.left
         y.left = x.right
+        if y.left:
+            y.left.parent = y
         x.right = y
+        x.parent = y.parent
+        y.parent = x
         self._update_height(y)
         self._update_height(x)
         return x
@@ -95,87 +495,575 @@ class AVLTree:
     def _rotate_left(self, x):
         y = x.right
         x.right = y.left
+        if x.right:
+            x.right.parent = x
         y.left = x
+        y.parent = x.parent
+        x.parent = y
         self._update_height(x)
         self._update_height(y)
         return y
 
     def insert(self, key, value):
-        self.root = self._insert(self.root, key, value)
+        handle = AVLNode(key, value)
+        self._insert(handle)
+        return handle
 
-    def _insert(self, node, key, value):
+    def _insert(self, new):
+        # Descenso sin recursión; el camino de vuelta son los parent
+        node = self.root
         if not node:
-            return AVLNode(key, value)
-
-        if key < node.key:
-            node.left = self._insert(node.left, key, value)
-        else:
-            node.right = self._insert(node.right, key, value)
+            self.root = new
+            new.parent = None
+            return
 
-        self._update_height(node)
-        balance = self._balance(node)
-
-        if balance > 1 and key < node.left.key:
-            return self._rotate_right(node)
-        if balance < -1 and key >= node.right.key:
-            return self._rotate_left(node)
-        if balance > 1 and key >= node.left.key:
-            node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
-        if balance < -1 and key < node.right.key:
-            node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
+        key = new.key
+        while True:
+            if key < node.key:
+                if not node.left:
+                    node.left = new
+                    break
+                node = node.left
+            else:
+                if not node.right:
+                    node.right = new
+                    break
+                node = node.right
+        new.parent = node
+        self._retrace(node)
 
-        return node
+    def min_key(self):
+        node = self.root
+        if not node:
+            return None
+        while node.left:
+            node = node.left
+        return node.key
 
     def extract_min(self):
-        if not self.root:
+        min_node = self.root
+        if not min_node:
             return None
-        self.root, min_node = self._extract_min(self.root)
+        while min_node.left:
+            min_node = min_node.left
+        parent = min_node.parent
+        self._replace(min_node, min_node.right)
+        self._retrace(parent)
+        min_node.parent = min_node.right = None
         return min_node.key, min_node.value
 
-    def _extract_min(self, node):
-        if not node.left:
-            return node.right, node
-        node.left, min_node = self._extract_min(node.left)
-        self._update_height(node)
+    def _rebalance(self, node):
         balance = self._balance(node)
-
         if balance < -1:
-            if self._balance(node.right) <= 0:
-                node = self._rotate_left(node)
-            else:
+            if self._balance(node.right) > 0:
                 node.right = self._rotate_right(node.right)
-                node = self._rotate_left(node)
+            node = self._rotate_left(node)
         elif balance > 1:
-            if self._balance(node.left) >= 0:
-                node = self._rotate_right(node)
-            else:
+            if self._balance(node.left) < 0:
                 node.left = self._rotate_left(node.left)
-                node = self._rotate_right(node)
-
-        return node, min_node
+            node = self._rotate_right(node)
+        return node
 
     def is_empty(self):
         return self.root is None
 
+    # -------------------- Handles: decrease_key --------------------
+
+    def _replace(self, old, new):
+        # Cuelga new (o None) donde estaba old
+        parent = old.parent
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+        if new:
+            new.parent = parent
+
+    def _retrace(self, node):
+        # Rebalanceo de abajo arriba desde node; se para en cuanto un subárbol
+        # conserva su altura, porque por encima ya nada cambia
+        while node is not None:
+            parent = node.parent
+            height = node.height
+            self._update_height(node)
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if parent is None:
+                    self.root = subtree
+                elif parent.left is node:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+            if subtree.height == height:
+                return
+            node = parent
+
+    def _unlink(self, node):
+        # Saca node moviendo nodos (no claves): los demás handles siguen valiendo
+        if node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            if successor.parent is node:
+                start = successor
+            else:
+                start = successor.parent
+                self._replace(successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.height = node.height  # altura previa del hueco, para la parada temprana
+            self._replace(node, successor)
+        else:
+            start = node.parent
+            self._replace(node, node.left or node.right)
+        self._retrace(start)
+        node.left = node.right = node.parent = None
+        node.height = 1
+
+    def _predecessor(self, node):
+        if node.left:
+            node = node.left
+            while node.right:
+                node = node.right
+            return node
+        while node.parent and node.parent.left is node:
+            node = node.parent
+        return node.parent
+
+    def decrease_key(self, handle, new_key):
+        # handle: el AVLNode devuelto por insert y aún no extraído
+        if new_key > handle.key:
+            raise ValueError(f"La clave nueva {new_key} es mayor que la actual {handle.key}")
+        predecessor = self._predecessor(handle)
+        if predecessor is None or predecessor.key <= new_key:
+            handle.key = new_key  # sigue en orden: basta cambiar la clave
+            return handle
+        self._unlink(handle)
+        handle.key = new_key
+        self._insert(handle)
+        return handle
+
+
+# ===========================================================
+#          TDA: BINARY HEAP (PRIORITY QUEUE, heapq)
+# ===========================================================
+
+class BinaryHeap:
+    # Misma interfaz que AVLTree; el contador desempata valores no comparables
+    def __init__(self):
+        self.heap = []
+        self._counter = count()
+
+    def insert(self, key, value):
+        heapq.heappush(self.heap, (key, next(self._counter), value))
+
+    def min_key(self):
+        return self.heap[0][0] if self.heap else None
+
+    def extract_min(self):
+        if not self.heap:
+            return None
+        key, _, value = heapq.heappop(self.heap)
+        return key, value
+
+    def is_empty(self):
+        return not self.heap
+
+
+# ===========================================================
+#        TDA: BUCKET QUEUE (DIAL, PESOS ENTEROS)
+# ===========================================================
+
+class BucketQueue:
+    # Cubetas circulares: las claves vivas están en [current, current + C]
+    def __init__(self, max_weight):
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.current = 0
+        self.size = 0
+
+    def _grow(self, span):
+        items = [item for bucket in self.buckets for item in bucket]
+        self.buckets = [[] for _ in range(2 * span)]
+        for key, value in items:
+            self.buckets[int(key) % len(self.buckets)].append((key, value))
+
+    def insert(self, key, value):
+        if key < self.current:
+            raise ValueError("BucketQueue es monótona: clave menor que el mínimo extraído")
+        span = int(key) - self.current + 1
+        if span > len(self.buckets):
+            # Un peso mayor que el máximo previsto: se amplía el anillo
+            self._grow(span)
+        self.buckets[int(key) % len(self.buckets)].append((key, value))
+        self.size += 1
+
+    def _advance(self):
+        while not self.buckets[self.current % len(self.buckets)]:
+            self.current += 1
+        return self.buckets[self.current % len(self.buckets)]
+
+    def min_key(self):
+        if not self.size:
+            return None
+        return self._advance()[-1][0]
+
+    def extract_min(self):
+        if not self.size:
+            return None
+        self.size -= 1
+        return self._advance().pop()
+
+    def is_empty(self):
+        return self.size == 0
+
+
+# ===========================================================
+#          TDA: RADIX HEAP (MONÓTONA, PESOS ENTEROS)
+# ===========================================================
+
+class RadixHeap:
+    # Cubeta i: claves cuyo bit más alto distinto de last es el i-ésimo
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.size = 0
+
+    def _bucket(self, key):
+        return (int(key) ^ self.last).bit_length()
+
+    def insert(self, key, value):
+        if key < self.last:
+            raise ValueError("RadixHeap es monótona: clave menor que el mínimo extraído")
+        index = self._bucket(key)
+        if index >= len(self.buckets):
+            self.buckets.extend([] for _ in range(index + 1 - len(self.buckets)))
+        self.buckets[index].append((key, value))
+        self.size += 1
+
+    def _refill(self):
+        if self.buckets[0]:
+            return
+        i = 1
+        while not self.buckets[i]:
+            i += 1
+        items = self.buckets[i]
+        self.buckets[i] = []
+        self.last = int(min(key for key, _ in items))
+        for item in items:
+            self.buckets[self._bucket(item[0])].append(item)
+
+    def min_key(self):
+        if not self.size:
+            return None
+        self._refill()
+        return self.buckets[0][-1][0]
+
+    def extract_min(self):
+        if not self.size:
+            return None
+        self._refill()
+        self.size -= 1
+        return self.buckets[0].pop()
+
+    def is_empty(self):
+        return self.size == 0
+
+
+DIAL_MAX_WEIGHT = 256
+
+
+def select_queue(integer_weights, max_weight):
+    # Pesos enteros pequeños -> Dial; enteros grandes -> radix; si no, AVL
+    if not integer_weights:
+        return AVLTree
+    if max_weight <= DIAL_MAX_WEIGHT:
+        return lambda: BucketQueue(max_weight)
+    return RadixHeap
+
+
+# ===========================================================
+#          TDA: SEARCH STATS (INSTRUMENTACIÓN OPCIONAL)
+# ===========================================================
+
+class SearchStats:
+    # hook(evento, stats, dato): "settle" con cada nodo fijado, "phase" al cerrar una fase
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.settled = 0
+        self.relaxed = 0      # aristas examinadas
+        self.improved = 0     # relajaciones que bajan una distancia (inserción en la cola)
+        self.stale = 0        # extracciones obsoletas descartadas
+        self.queue_size = 0
+        self.peak_queue = 0
+        self.rotations = 0
+        self.phases = {}      # fase -> segundos
+        self._phase = None
+        self._phase_start = 0.0
+
+    def push(self):
+        self.queue_size += 1
+        if self.queue_size > self.peak_queue:
+            self.peak_queue = self.queue_size
+
+    def pop(self):
+        self.queue_size -= 1
+
+    def settle(self, node):
+        self.settled += 1
+        if self.hook is not None:
+            self.hook("settle", self, node)
+
+    def phase(self, name):
+        # Cierra la fase en curso y abre la siguiente; None solo cierra
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_start
+            if self.hook is not None:
+                self.hook("phase", self, self._phase)
+        self._phase = name
+        self._phase_start = now
+
+    def instrument(self, queue):
+        # Solo el AVL rota; las demás colas se usan tal cual
+        return InstrumentedAVLTree(self) if type(queue) is AVLTree else queue
+
+    def as_dict(self):
+        return {
+            "settled": self.settled,
+            "relaxed": self.relaxed,
+            "improved": self.improved,
+            "stale": self.stale,
+            "peak_queue": self.peak_queue,
+            "rotations": self.rotations,
+            "phases": dict(self.phases),
+        }
+
+
+class InstrumentedAVLTree(AVLTree):
+    # Cuenta rotaciones; el AVLTree normal no paga nada por ello
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+
+    def _rotate_right(self, y):
+        self.stats.rotations += 1
+        return super()._rotate_right(y)
+
+    def _rotate_left(self, x):
+        self.stats.rotations += 1
+        return super()._rotate_left(x)
+
+
+# ===========================================================
+#          TDA: SEARCH WORKSPACE (ESTADO POR CONSULTA)
+# ===========================================================
+
+class SearchWorkspace:
+    # Una entrada solo es válida si stamp[i] == generation: reset() es O(1)
+    def __init__(self, size=0):
+        self.dist = array('d', [float('inf')]) * size
+        self.prev = array('i', [-1]) * size
+        self.stamp = array('q', [0]) * size
+        self.generation = 0
+        self.touched = []
+
+    def reset(self, size):
+        grow = size - len(self.stamp)
+        if grow > 0:
+            self.dist.extend(array('d', [float('inf')]) * grow)
+            self.prev.extend(array('i', [-1]) * grow)
+            self.stamp.extend(array('q', [0]) * grow)
+        self.generation += 1
+        self.touched = []
+
+    def visit(self, i, distance, previous):
+        if self.stamp[i] != self.generation:
+            self.stamp[i] = self.generation
+            self.touched.append(i)
+        self.dist[i] = distance
+        self.prev[i] = previous
+
+    def distance(self, i):
+        return self.dist[i] if self.stamp[i] == self.generation else float('inf')
+
+
+# ===========================================================
+#            TDA: SEARCH RESULT (ÁRBOL DE CAMINOS)
+# ===========================================================
+
+def iter_tree_paths(order, parents, name_of, destinations=None):
+    # Profundidad sobre el árbol: O(n + longitud total de los caminos generados)
+    if not order:
+        return
+    children = {}
+    for i in order[1:]:
+        children.setdefault(parents[i], []).append(i)
+
+    wanted = set(destinations) if destinations is not None else None
+    path = []
+    stack = [(order[0], 0)]
+    while stack:
+        i, depth = stack.pop()
+        del path[depth:]
+        path.append(name_of(i))
+        if wanted is None or i in wanted:
+            yield list(path)
+            if wanted is not None:
+                wanted.discard(i)
+                if not wanted:
+                    return
+        stack.extend((child, depth + 1) for child in children.get(i, ()))
+
+
+class SearchResult:
+    def __init__(self, graph, source, dist, prev, order=None):
+        self.graph = graph
+        self.source = source
+        self.dist = dist  # id -> distancia, solo nodos alcanzados
+        self.prev = prev  # id -> id del predecesor (-1 en el origen)
+        self.order = order  # ids en orden de fijación: cada padre antes que sus hijos
+
+    def topological_order(self):
+        if self.order is None:
+            # Árbol adoptado o reparado: orden en anchura desde el origen
+            children = {}
+            for child, parent in self.prev.items():
+                children.setdefault(parent, []).append(child)
+            order = array('i', children.get(-1, ()))
+            for i in order:
+                order.extend(children.get(i, ()))
+            self.order = order
+        return self.order
+
+    def parent_array(self):
+        # (padres, orden); padres[i] == -1 en el origen y en los no alcanzados
+        parents = array('i', [-1]) * len(self.graph.node_list)
+        for child, parent in self.prev.items():
+            parents[child] = parent
+        return parents, self.topological_order()
+
+    def iter_paths(self, destination_names=None):
+        # Sin destinos: todos los caminos, en orden de profundidad del árbol
+        node_list = self.graph.node_list
+        ids = None
+        if destination_names is not None:
+            nodes = (self.graph.get_node(name) for name in destination_names)
+            ids = [node.id for node in nodes if node is not None]
+        return iter_tree_paths(self.topological_order(), self.prev,
+                               lambda i: node_list[i].name, ids)
+
+    def get_paths(self, destination_names):
+        destination_names = list(destination_names)
+        paths = {path[-1]: path for path in self.iter_paths(destination_names)}
+        return {name: paths.get(name, []) for name in destination_names}
+
+    def get_distance(self, destination_name):
+        node = self.graph.get_node(destination_name)
+        return self.dist.get(node.id, float('inf')) if node else float('inf')
+
+    def get_path(self, destination_name):
+        node = self.graph.get_node(destination_name)
+        if not node or node.id not in self.dist:
+            return []
+
+        path = []
+        current = node.id
+        while current != -1:
+            path.append(self.graph.node_list[current].name)
+            current = self.prev[current]
+        return path[::-1]
+
+
+# ===========================================================
+#          TDA: ISOCHRONE (ALCANCE CON PRESUPUESTO)
+# ===========================================================
+
+class Isochrone:
+    # Ids compactos: nodos alcanzables (en orden de distancia) y aristas frontera
+    def __init__(self, source, budget):
+        self.source = source
+        self.budget = budget
+        self.nodes = array('i')
+        self.distances = array('d')
+        self.boundary_from = array('i')
+        self.boundary_to = array('i')
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def boundary(self):
+        return list(zip(self.boundary_from, self.boundary_to))
+
+
+def _bounded_search(start, budget, workspace, queue, arcs):
+    # arcs(u) -> iterable de (v, peso); las relajaciones por encima del presupuesto se podan
+    dist, stamp, generation = workspace.dist, workspace.stamp, workspace.generation
+    result = Isochrone(start, budget)
+    pruned = []
+
+    workspace.visit(start, 0, -1)
+    pq = queue()
+    pq.insert(0, start)
+
+    while not pq.is_empty():
+        d, u = pq.extract_min()
+        if d > dist[u]:
+            continue
+        result.nodes.append(u)
+        result.distances.append(d)
+
+        for v, weight in arcs(u):
+            new_dist = d + weight
+            if new_dist > budget:
+                pruned.append((u, v))
+            elif stamp[v] != generation or new_dist < dist[v]:
+                workspace.visit(v, new_dist, u)
+                pq.insert(new_dist, v)
+
+    # Frontera: aristas podadas cuyo destino no entró en la isócrona
+    for u, v in pruned:
+        if stamp[v] != generation:
+            result.boundary_from.append(u)
+            result.boundary_to.append(v)
+    return result
+
 
 # ===========================================================
 #              TDA: DIJKSTRA ALGORITHM
 # ===========================================================
 
 class Dijkstra:
-    def __init__(self, graph):
+    def __init__(self, graph, queue=None):
         self.graph = graph
+        self.queue = queue  # None: se elige según los pesos del grafo
+        self._local = threading.local()  # un workspace por hilo
+
+    def _new_queue(self):
+        if self.queue is not None:
+            return self.queue()
+        return select_queue(self.graph.integer_weights, self.graph.max_weight)()
+
+    def _workspace(self):
+        workspace = getattr(self._local, "workspace", None)
+        if workspace is None:
+            workspace = self._local.workspace = SearchWorkspace()
+        return workspace
+
+    def run(self, start_name, stats=None):
+        if stats is not None:
+            return self._run_instrumented(start_name, stats)
 
-    def run(self, start_name):
         self.graph.reset_distances()
         start = self.graph.get_node(start_name)
         if not start:
             raise ValueError(f"Nodo '{start_name}' no existe")
 
         start.distance = 0
-        pq = AVLTree()
+        pq = self._new_queue()
         pq.insert(0, start)
 
         while not pq.is_empty():
@@ -193,6 +1081,76 @@ class Dijkstra:
                     neighbor.previous = node
                     pq.insert(new_dist, neighbor)
 
+    def run_decrease_key(self, start_name):
+        # Una sola entrada por nodo en el AVL (cola acotada por V): al mejorar
+        # una distancia se baja la clave de su handle en vez de reinsertar.
+        # Siempre AVLTree: es la única cola con handles y decrease_key, así que
+        # self.queue no se usa aquí
+        self.graph.reset_distances()
+        start = self.graph.get_node(start_name)
+        if not start:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+
+        start.distance = 0
+        pq = AVLTree()
+        handles = [None] * len(self.graph.node_list)
+        handles[start.id] = pq.insert(0, start)
+
+        while not pq.is_empty():
+            _, node = pq.extract_min()
+            handles[node.id] = None
+
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = node.distance + edge.weight
+
+                if new_dist < neighbor.distance:
+                    neighbor.distance = new_dist
+                    neighbor.previous = node
+                    handle = handles[neighbor.id]
+                    if handle is None:
+                        handles[neighbor.id] = pq.insert(new_dist, neighbor)
+                    else:
+                        pq.decrease_key(handle, new_dist)
+
+    def _run_instrumented(self, start_name, stats):
+        # Mismo bucle que run con contadores: sin stats, run no paga ninguna comprobación
+        stats.phase("reset")
+        self.graph.reset_distances()
+        start = self.graph.get_node(start_name)
+        if not start:
+            stats.phase(None)
+            raise ValueError(f"Nodo '{start_name}' no existe")
+
+        stats.phase("search")
+        start.distance = 0
+        pq = stats.instrument(self._new_queue())
+        pq.insert(0, start)
+        stats.push()
+
+        while not pq.is_empty():
+            dist, node = pq.extract_min()
+            stats.pop()
+
+            if dist > node.distance:
+                stats.stale += 1
+                continue
+            stats.settle(node)
+
+            for edge in node.edges:
+                stats.relaxed += 1
+                neighbor = edge.destination
+                new_dist = node.distance + edge.weight
+
+                if new_dist < neighbor.distance:
+                    neighbor.distance = new_dist
+                    neighbor.previous = node
+                    pq.insert(new_dist, neighbor)
+                    stats.improved += 1
+                    stats.push()
+
+        stats.phase(None)
+
     def get_path(self, destination_name):
         dest = self.graph.get_node(destination_name)
         if not dest or dest.distance == float('inf'):
@@ -209,6 +1167,267 @@ class Dijkstra:
         node = self.graph.get_node(destination_name)
         return node.distance if node else float('inf')
 
+    def query(self, start_name, workspace=None):
+        # Reentrante: no escribe en los GraphNode ni llama a reset_distances
+        start = self.graph.get_node(start_name)
+        if not start:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+
+        ws = workspace if workspace is not None else self._workspace()
+        ws.reset(len(self.graph.node_list))
+        dist, stamp, generation = ws.dist, ws.stamp, ws.generation
+
+        ws.visit(start.id, 0, -1)
+        pq = self._new_queue()
+        pq.insert(0, start)
+        order = array('i')
+
+        while not pq.is_empty():
+            d, node = pq.extract_min()
+
+            if d > dist[node.id]:
+                continue
+            order.append(node.id)
+
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = d + edge.weight
+
+                if stamp[neighbor.id] != generation or new_dist < dist[neighbor.id]:
+                    ws.visit(neighbor.id, new_dist, node.id)
+                    pq.insert(new_dist, neighbor)
+
+        return SearchResult(self.graph, start,
+                            {i: dist[i] for i in ws.touched},
+                            {i: ws.prev[i] for i in ws.touched}, order)
+
+    def isochrone(self, start_name, budget, workspace=None):
+        start = self.graph.get_node(start_name)
+        if not start:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+
+        ws = workspace if workspace is not None else self._workspace()
+        ws.reset(len(self.graph.node_list))
+        node_list = self.graph.node_list
+
+        def arcs(u):
+            return ((edge.destination.id, edge.weight) for edge in node_list[u].edges)
+
+        return _bounded_search(start.id, budget, ws, self._new_queue, arcs)
+
+    def iter_settled(self, start_name):
+        # Genera (nodo, distancia) en orden no decreciente; se puede cortar en cualquier momento
+        start = self.graph.get_node(start_name)
+        if not start:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+
+        # Estado propio en diccionarios: el generador puede quedar suspendido
+        dist = {start: 0}
+        settled = set()
+        pq = self._new_queue()
+        pq.insert(0, start)
+
+        while not pq.is_empty():
+            d, node = pq.extract_min()
+            if node in settled:
+                continue
+            settled.add(node)
+            yield node, d
+
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = d + edge.weight
+                if new_dist < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = new_dist
+                    pq.insert(new_dist, neighbor)
+
+    def k_nearest(self, start_name, k, predicate=None):
+        # El propio origen cuenta si cumple el predicado
+        found = []
+        if k <= 0:
+            return found
+        for node, distance in self.iter_settled(start_name):
+            if predicate is None or predicate(node):
+                found.append((node, distance))
+                if len(found) == k:
+                    break
+        return found
+
+    def within(self, start_name, radius):
+        found = []
+        for node, distance in self.iter_settled(start_name):
+            if distance > radius:
+                break
+            found.append((node, distance))
+        return found
+
+    def shortest_path(self, source_name, target_name):
+        # Devuelve (distancia, camino, nodos fijados): nada se guarda en el motor compartido
+        source = self.graph.get_node(source_name)
+        target = self.graph.get_node(target_name)
+        if not source:
+            raise ValueError(f"Nodo '{source_name}' no existe")
+        if not target:
+            raise ValueError(f"Nodo '{target_name}' no existe")
+
+        # Estado local de la consulta: no se tocan distance/previous
+        dist = ({source: 0}, {target: 0})
+        parent = ({source: None}, {target: None})
+        settled = (set(), set())
+        queues = (self._new_queue(), self._new_queue())
+        queues[0].insert(0, source)
+        queues[1].insert(0, target)
+
+        best = 0 if source is target else float('inf')
+        meeting = source if source is target else None
+        settled_count = 0
+
+        while not queues[0].is_empty() and not queues[1].is_empty():
+            top_f, top_b = queues[0].min_key(), queues[1].min_key()
+            # Ninguna ruta por nodos aún sin fijar puede mejorar best
+            if top_f + top_b >= best:
+                break
+
+            side = 0 if top_f <= top_b else 1
+            d, node = queues[side].extract_min()
+            if node in settled[side]:
+                continue
+            settled[side].add(node)
+            settled_count += 1
+
+            if side == 0:
+                arcs = ((edge.destination, edge.weight) for edge in node.edges)
+            else:
+                arcs = ((edge.source, edge.weight) for edge in self.graph.reverse_edges(node))
+
+            own, other = dist[side], dist[1 - side]
+            for neighbor, weight in arcs:
+                new_dist = d + weight
+                if new_dist < own.get(neighbor, float('inf')):
+                    own[neighbor] = new_dist
+                    parent[side][neighbor] = node
+                    queues[side].insert(new_dist, neighbor)
+                if neighbor in other and new_dist + other[neighbor] < best:
+                    best = new_dist + other[neighbor]
+                    meeting = neighbor
+
+        if meeting is None:
+            return float('inf'), [], settled_count
+
+        path = []
+        current = meeting
+        while current:
+            path.append(current.name)
+            current = parent[0][current]
+        path.reverse()
+        current = parent[1][meeting]
+        while current:
+            path.append(current.name)
+            current = parent[1][current]
+        return best, path, settled_count
+
+
+# ===========================================================
+#              TDA: DIJKSTRA SOBRE CSR
+# ===========================================================
+
+class DijkstraCSR:
+    def __init__(self, csr, queue=None):
+        self.csr = csr
+        if queue is None:
+            queue = select_queue(*csr.weight_profile())
+        self.queue = queue
+        self.dist = array('d')
+        self.prev = array('i')
+        self.order = array('i')  # nodos fijados, cada padre antes que sus hijos
+
+    def run(self, start_name):
+        start = self.csr.id_of(start_name)
+        if start is None:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+        self.run_id(start)
+
+    def run_id(self, start, stop_at=None):
+        # stop_at: ids que, una vez fijados todos, cortan la búsqueda
+        remaining = set(stop_at) if stop_at is not None else None
+        n = self.csr.num_nodes()
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+        # Listas durante la búsqueda (leer de un array crea un float nuevo en
+        # cada acceso); al terminar se compactan en arrays
+        dist = [float('inf')] * n
+        prev = [-1] * n
+
+        dist[start] = 0
+        pq = self.queue()
+        pq.insert(0, start)
+        order = array('i')
+
+        while not pq.is_empty():
+            d, u = pq.extract_min()
+
+            if d > dist[u]:
+                continue
+            order.append(u)
+
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_dist = d + weights[i]
+
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    prev[v] = u
+                    pq.insert(new_dist, v)
+
+        self.dist = array('d', dist)
+        self.prev = array('i', prev)
+        self.order = order
+
+    def parent_array(self):
+        # Con stop_at el orden solo cubre los nodos fijados antes del corte
+        return self.prev, self.order
+
+    def iter_paths(self, destination_names=None):
+        ids = None
+        if destination_names is not None:
+            ids = [i for i in map(self.csr.id_of, destination_names) if i is not None]
+        return iter_tree_paths(self.order, self.prev, self.csr.names.__getitem__, ids)
+
+    def get_paths(self, destination_names):
+        destination_names = list(destination_names)
+        paths = {path[-1]: path for path in self.iter_paths(destination_names)}
+        return {name: paths.get(name, []) for name in destination_names}
+
+    def isochrone_id(self, start, budget, workspace=None):
+        ws = workspace if workspace is not None else SearchWorkspace()
+        ws.reset(self.csr.num_nodes())
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+
+        def arcs(u):
+            return ((targets[i], weights[i]) for i in range(offsets[u], offsets[u + 1]))
+
+        return _bounded_search(start, budget, ws, self.queue, arcs)
+
+    def get_path(self, destination_name):
+        dest = self.csr.id_of(destination_name)
+        if dest is None or self.dist[dest] == float('inf'):
+            return []
+
+        path = []
+        current = dest
+        while current != -1:
+            path.append(self.csr.names[current])
+            current = self.prev[current]
+        return path[::-1]
+
+    def get_distance(self, destination_name):
+        node_id = self.csr.id_of(destination_name)
+        return self.dist[node_id] if node_id is not None else float('inf')
+
 
 # ===========================================================
 #                    EJEMPLO DE USO
@@ -238,4 +1457,33 @@ if __name__ == "__main__":
     for dest in ["B", "C", "D", "E", "F"]:
         path = dijkstra.get_path(dest)
         dist = dijkstra.get_distance(dest)
-        print(f"A → {dest}: {' → '.join(path)} (distancia: {dist})")
\ No newline at end of file
+        print(f"A → {dest}: {' → '.join(path)} (distancia: {dist})")
+
+    distance, path, settled = dijkstra.shortest_path("A", "F")
+    print(f"\nBIDIRECCIONAL A → F: {' → '.join(path)} (distancia: {distance}, "
+          f"nodos fijados: {settled})")
+
+    print("\nLOS 3 MÁS CERCANOS A D:", [(n.name, d) for n, d in dijkstra.k_nearest("D", 3)])
+    print("A MENOS DE 5 DE A:", [(n.name, d) for n, d in dijkstra.within("A", 5)])
+
+    stats = SearchStats()
+    Dijkstra(g, AVLTree).run("A", stats=stats)
+    print("\nESTADÍSTICAS (AVL):", stats.as_dict())
+
+    # Consultas concurrentes sobre el mismo grafo, cada hilo con su workspace
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(dijkstra.query, ["A", "C", "D"]))
+    print("\nCONSULTAS CONCURRENTES (distancia a F):")
+    for result in results:
+        print(f"{result.source.name} → F: {result.get_distance('F')}")
+
+    # Snapshot binario: al cargarlo con mmap no se reconstruye ningún objeto
+    import os
+    import tempfile
+    snapshot = os.path.join(tempfile.gettempdir(), "grafo_ejemplo.grph")
+    g.save(snapshot)
+    csr_dijkstra = DijkstraCSR(CSRGraph.load(snapshot, mmap=True))
+    csr_dijkstra.run("A")
+    print(f"\nDESDE SNAPSHOT MAPEADO A → F: {' → '.join(csr_dijkstra.get_path('F'))} "
+          f"(distancia: {csr_dijkstra.get_distance('F')})")
@@ -0,0 +1,151 @@
+import math
+
+from Djkstra_sin_paja import Graph, AVLTree, BinaryHeap
+
+
+# ===========================================================
+#                 HEURÍSTICAS ADMISIBLES
+# ===========================================================
+#
+# Solo son admisibles si ningún peso es menor que la distancia
+# geométrica entre sus extremos (mismas unidades). Basta con que la
+# heurística sea admisible: AStar reabre un nodo si su distancia mejora,
+# así que una heurística inconsistente (p. ej. coords solo en algunos
+# nodos, o un callable del usuario) cuesta expansiones, no exactitud.
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def euclidean(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def haversine(a, b):
+    # coords = (lat, lon) en grados, resultado en km
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def zero(a, b):
+    return 0
+
+
+HEURISTICS = {
+    "euclidean": euclidean,
+    "manhattan": manhattan,
+    "haversine": haversine,
+    "dijkstra": zero,
+}
+
+
+# ===========================================================
+#                   TDA: A* SEARCH
+# ===========================================================
+
+class AStar:
+    def __init__(self, graph, heuristic="euclidean", queue=AVLTree):
+        self.graph = graph
+        self.queue = queue
+        if callable(heuristic):
+            self.heuristic = heuristic
+        elif heuristic in HEURISTICS:
+            self.heuristic = HEURISTICS[heuristic]
+        else:
+            raise ValueError(f"Heurística '{heuristic}' desconocida")
+        self.settled = 0
+        self.relaxed = 0
+
+    def _estimate(self, node, target):
+        # Sin coordenadas no hay estimación: h = 0 sigue siendo admisible
+        if node.coords is None or target.coords is None:
+            return 0
+        return self.heuristic(node.coords, target.coords)
+
+    def run(self, source_name, target_name):
+        source = self.graph.get_node(source_name)
+        target = self.graph.get_node(target_name)
+        if not source:
+            raise ValueError(f"Nodo '{source_name}' no existe")
+        if not target:
+            raise ValueError(f"Nodo '{target_name}' no existe")
+
+        dist = {source: 0}
+        previous = {source: None}
+        self.settled = 0
+        self.relaxed = 0
+
+        # Cada entrada lleva la g con la que se insertó: solo se descartan las
+        # obsoletas, y un nodo ya expandido se reabre si baja su distancia
+        pq = self.queue()
+        pq.insert(self._estimate(source, target), (0, source))
+
+        while not pq.is_empty():
+            _, (g, node) = pq.extract_min()
+            if g > dist[node]:
+                continue
+            self.settled += 1
+
+            if node is target:
+                path = []
+                while node:
+                    path.append(node.name)
+                    node = previous[node]
+                return dist[target], path[::-1]
+
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = dist[node] + edge.weight
+                self.relaxed += 1
+
+                if new_dist < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = new_dist
+                    previous[neighbor] = node
+                    pq.insert(new_dist + self._estimate(neighbor, target), (new_dist, neighbor))
+
+        return float('inf'), []
+
+    def compare_with_dijkstra(self, source_name, target_name):
+        distance, path = self.run(source_name, target_name)
+        astar_settled = self.settled
+
+        plain = AStar(self.graph, "dijkstra", self.queue)
+        plain.run(source_name, target_name)
+
+        return {
+            "distance": distance,
+            "path": path,
+            "astar_settled": astar_settled,
+            "dijkstra_settled": plain.settled,
+            "saved": plain.settled - astar_settled,
+        }
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    # Cuadrícula 20x20 con coordenadas; peso = distancia real
+    g = Graph()
+    size = 20
+    for x in range(size):
+        for y in range(size):
+            g.add_node((x, y), coords=(x, y))
+    for x in range(size):
+        for y in range(size):
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= x + dx < size and 0 <= y + dy < size:
+                    g.add_edge((x, y), (x + dx, y + dy), 1)
+
+    for name in ("euclidean", "manhattan"):
+        for queue in (AVLTree, BinaryHeap):
+            stats = AStar(g, name, queue).compare_with_dijkstra((0, 0), (15, 12))
+            print(f"{name:<10} {queue.__name__:<11} distancia={stats['distance']} "
+                  f"A*={stats['astar_settled']} Dijkstra={stats['dijkstra_settled']} "
+                  f"ahorro={stats['saved']}")
@@ -0,0 +1,125 @@
+# ===========================================================
+#     BENCHMARK: AVL ITERATIVO FRENTE A AVL RECURSIVO
+# ===========================================================
+#
+# Operaciones por segundo de n inserciones seguidas de n extracciones
+# del mínimo. Se comparan:
+#   - AVLTree (cola de Djkstra_sin_paja) con la versión recursiva que
+#     tenía antes, reproducida en RecursiveAVLTree;
+#   - ArbolAVL de 5_Simplified/grafo.py con djkstraaa.py, copia que
+#     conserva insertar/eliminar recursivos.
+#
+# Uso: python benchmark_avl.py [n]   (por defecto 10^6)
+
+import random
+import sys
+import time
+
+from Djkstra_sin_paja import AVLTree
+from benchmark_implementaciones import load_module
+
+
+# ===========================================================
+#        REFERENCIA: AVLTree CON INSERCIÓN RECURSIVA
+# ===========================================================
+
+class RecursiveAVLTree(AVLTree):
+    # Bajada y subida por la pila de Python, rebalanceando todo el camino
+    def _insert(self, new):
+        self.root = self._insert_below(self.root, new)
+        self.root.parent = None
+
+    def _insert_below(self, node, new):
+        if not node:
+            return new
+
+        if new.key < node.key:
+            node.left = self._insert_below(node.left, new)
+            node.left.parent = node
+        else:
+            node.right = self._insert_below(node.right, new)
+            node.right.parent = node
+
+        self._update_height(node)
+        return self._rebalance(node)
+
+    def extract_min(self):
+        if not self.root:
+            return None
+        self.root, min_node = self._extract_min(self.root)
+        if self.root:
+            self.root.parent = None
+        min_node.parent = min_node.right = None
+        return min_node.key, min_node.value
+
+    def _extract_min(self, node):
+        if not node.left:
+            return node.right, node
+        node.left, min_node = self._extract_min(node.left)
+        if node.left:
+            node.left.parent = node
+        self._update_height(node)
+        return self._rebalance(node), min_node
+
+
+# ===========================================================
+#                       MEDICIÓN
+# ===========================================================
+
+def _rate(n, operation):
+    start = time.perf_counter()
+    operation()
+    return n / (time.perf_counter() - start)
+
+
+def queue_rates(queue_class, keys):
+    queue = queue_class()
+
+    def insert_all():
+        for i, key in enumerate(keys):
+            queue.insert(key, i)
+
+    def extract_all():
+        extracted = [queue.extract_min()[0] for _ in range(len(keys))]
+        assert extracted == sorted(keys)
+
+    return _rate(len(keys), insert_all), _rate(len(keys), extract_all)
+
+
+def set_rates(module, keys):
+    tree = module.ArbolAVL()
+
+    def insert_all():
+        for key in keys:
+            tree.raiz = tree.insertar(tree.raiz, key)
+
+    def extract_all():
+        while tree.raiz:
+            tree.raiz = tree.eliminar(tree.raiz, tree.obtener_minimo(tree.raiz).vertice)
+
+    return _rate(len(keys), insert_all), _rate(len(keys), extract_all)
+
+
+def main(n=10 ** 6):
+    rng = random.Random(n)
+    keys = [rng.random() for _ in range(n)]
+    vertices = rng.sample(range(10 * n), n)
+
+    iterative = load_module("grafo", "5_Simplified/grafo.py")
+    recursive = load_module("djkstraaa", "5_Simplified/djkstraaa.py")
+    cases = [
+        ("AVLTree recursivo", lambda: queue_rates(RecursiveAVLTree, keys)),
+        ("AVLTree iterativo", lambda: queue_rates(AVLTree, keys)),
+        ("ArbolAVL recursivo", lambda: set_rates(recursive, vertices)),
+        ("ArbolAVL iterativo", lambda: set_rates(iterative, vertices)),
+    ]
+
+    print(f"n = {n:,}\n")
+    print(f"{'árbol':<22}{'inserciones/s':>16}{'extracciones/s':>17}")
+    for name, run in cases:
+        inserts, extracts = run()
+        print(f"{name:<22}{inserts:>16,.0f}{extracts:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
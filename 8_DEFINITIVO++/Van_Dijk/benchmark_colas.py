@@ -0,0 +1,66 @@
+# ===========================================================
+#    BENCHMARK: COLAS DE PRIORIDAD CON PESOS ENTEROS
+# ===========================================================
+#
+# Compara AVLTree, BinaryHeap, BucketQueue (Dial) y RadixHeap
+# ejecutando DijkstraCSR sobre grafos aleatorios de 10^3 a 10^6 nodos.
+#
+# Uso: python benchmark_colas.py [exponente_máximo] [peso_máximo]
+
+import random
+import sys
+import time
+from array import array
+
+from Djkstra_sin_paja import (CSRGraph, DijkstraCSR, AVLTree, BinaryHeap,
+                              BucketQueue, RadixHeap)
+
+DEGREE = 4
+
+
+def random_csr(num_nodes, max_weight, seed=0):
+    # Grado fijo: offsets[u] = u * DEGREE, sin pasar por Graph
+    rng = random.Random(seed)
+    offsets = array('q', range(0, num_nodes * DEGREE + 1, DEGREE))
+    targets = array('i', (rng.randrange(num_nodes) for _ in range(num_nodes * DEGREE)))
+    weights = array('d', (rng.randint(1, max_weight) for _ in range(num_nodes * DEGREE)))
+    return CSRGraph(list(range(num_nodes)), offsets, targets, weights)
+
+
+def throughput(csr, queue):
+    engine = DijkstraCSR(csr, queue)
+    start = time.perf_counter()
+    engine.run_id(0)
+    elapsed = time.perf_counter() - start
+    reached = sum(1 for d in engine.dist if d != float('inf'))
+    return reached / elapsed, engine.dist
+
+
+def main(max_exponent=6, max_weight=100):
+    queues = [
+        ("AVLTree", AVLTree),
+        ("BinaryHeap", BinaryHeap),
+        ("BucketQueue", lambda: BucketQueue(max_weight)),
+        ("RadixHeap", RadixHeap),
+    ]
+
+    print(f"Grado {DEGREE}, pesos enteros en [1, {max_weight}] (nodos fijados por segundo)\n")
+    print(f"{'nodos':>10}" + "".join(f"{name:>14}" for name, _ in queues))
+
+    for exponent in range(3, max_exponent + 1):
+        csr = random_csr(10 ** exponent, max_weight, seed=exponent)
+        row = []
+        reference = None
+        for _, queue in queues:
+            rate, dist = throughput(csr, queue)
+            if reference is None:
+                reference = dist
+            elif dist != reference:
+                raise AssertionError("Las colas no producen las mismas distancias")
+            row.append(rate)
+        print(f"{10 ** exponent:>10}" + "".join(f"{rate:>14,.0f}" for rate in row))
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,327 @@
+# ===========================================================
+#   BENCHMARK: IMPLEMENTACIONES DE DIJKSTRA DEL REPOSITORIO
+# ===========================================================
+#
+# Ejecuta cada variante (cargada desde su fichero, sin tocarla) sobre
+# grafos sintéticos con semilla: rejilla, geométrico aleatorio y libre
+# de escala, de 10^2 a 10^max nodos. Guarda tiempo, pico de memoria y
+# contadores de operaciones en JSON y, con --baseline, falla (código 1)
+# si algún caso empeora más del umbral respecto a la referencia.
+#
+# Uso: python benchmark_implementaciones.py [--max-exponent 4] [--output res.json]
+#                                            [--baseline base.json] [--threshold 0.25]
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from Djkstra_sin_paja import Graph, Dijkstra, DijkstraCSR, AVLTree, BinaryHeap, SearchStats
+from generadores import grid, random_geometric, barabasi_albert, to_csr
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_module(name, relative_path):
+    # Algunos ficheros ejecutan su ejemplo al importarse: se silencia
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        spec.loader.exec_module(module)
+    return module
+
+
+# ===========================================================
+#                 GRAFOS SINTÉTICOS CON SEMILLA
+# ===========================================================
+
+MODELS = {
+    "grid": lambda n, seed: grid(max(2, round(math.sqrt(n))), seed=seed),
+    "geometric": lambda n, seed: random_geometric(n, seed=seed),
+    "scale_free": lambda n, seed: barabasi_albert(n, seed=seed),
+}
+
+
+def build_csr(model, n, seed):
+    # Sin aristas paralelas: DijkstraConAVL guarda un solo peso por vecino
+    return to_csr(MODELS[model](n, seed), dedupe="min")
+
+
+def pick_source(csr, attempts=20):
+    # El geométrico no es conexo: se busca un origen dentro de la componente gigante
+    engine = DijkstraCSR(csr, BinaryHeap)
+    n = csr.num_nodes()
+    for source in range(min(n, attempts)):
+        engine.run_id(source)
+        if sum(1 for d in engine.dist if d != float('inf')) * 2 >= n:
+            break
+    return source, engine.dist
+
+
+def edges_of(csr):
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    for u in range(csr.num_nodes()):
+        for i in range(offsets[u], offsets[u + 1]):
+            yield u, targets[i], weights[i]
+
+
+# ===========================================================
+#        ADAPTADORES: CONSTRUIR EL GRAFO Y EJECUTAR
+# ===========================================================
+#
+# build(csr) -> grafo propio de la implementación
+# run(grafo, origen, destino, stats) -> {id: distancia} de lo que calcula
+# stats: None en las ejecuciones cronometradas; dict de contadores si no
+
+class CoreDijkstra:
+    def __init__(self, queue, decrease_key=False):
+        self.queue = queue
+        self.decrease_key = decrease_key  # run_decrease_key: cola acotada por V
+
+    def build(self, csr):
+        g = Graph()
+        for u in range(csr.num_nodes()):
+            g.add_node(u)
+        for u, v, w in edges_of(csr):
+            g.add_edge(u, v, w)
+        return g
+
+    def run(self, g, source, target, stats):
+        if self.decrease_key:
+            Dijkstra(g, self.queue).run_decrease_key(source)
+            return {node.id: node.distance for node in g.node_list
+                    if node.distance != float('inf')}
+        search = SearchStats() if stats is not None else None
+        Dijkstra(g, self.queue).run(source, stats=search)
+        if search is not None:
+            stats.update(search.as_dict())
+            del stats["phases"]
+        return {node.id: node.distance for node in g.node_list if node.distance != float('inf')}
+
+
+class MinHeapDijkstra:
+    def __init__(self):
+        self.module = load_module("dijkstra_1", "2_Djikstra/dijkstra_1.py")
+
+    def build(self, csr):
+        g = self.module.Graph()
+        for u in range(csr.num_nodes()):
+            g.add_vertex(u)
+        for u, v, w in edges_of(csr):
+            g.add_edge(u, v, w)
+        return g
+
+    def run(self, g, source, target, stats):
+        module = self.module
+        original = module.MinHeap
+        if stats is not None:
+            stats.update(push=0, pop=0)
+
+            class CountingMinHeap(original):
+                def push(self, item):
+                    stats["push"] += 1
+                    super().push(item)
+
+                def pop(self):
+                    stats["pop"] += 1
+                    return super().pop()
+
+            module.MinHeap = CountingMinHeap
+        try:
+            module.Dijkstra(g).run(source)
+        finally:
+            module.MinHeap = original
+        return {v.name: v.distance for v in g.vertices.values() if v.distance != float('inf')}
+
+
+class SortedListDijkstra:
+    def __init__(self):
+        self.module = load_module("Ruben_sin_heap", "2_Djikstra/Ruben_sin_heap.py")
+
+    def build(self, csr):
+        g = self.module.Graph()
+        for u in range(csr.num_nodes()):
+            g.add_vertex(u)
+        for u, v, w in edges_of(csr):
+            g.add_edge(u, v, w)
+        return g
+
+    def run(self, g, source, target, stats):
+        for v in g.vertices.values():  # la función no reinicia el grafo
+            v.distance = float('inf')
+            v.previous = None
+        self.module.dijkstra(g, source)
+        return {v.name: v.distance for v in g.vertices.values() if v.distance != float('inf')}
+
+
+class LinearScanDijkstra:
+    def __init__(self):
+        self.module = load_module("gemini_CON_aux", "2_Djikstra/gemini_CON_aux.py")
+
+    def build(self, csr):
+        g = self.module.Grafo(dirigido=True)
+        for u in range(csr.num_nodes()):
+            g.agregar_vertice(u)
+        for u, v, w in edges_of(csr):
+            g.agregar_arista(u, v, w)
+        return g
+
+    def run(self, g, source, target, stats):
+        # Solo calcula hasta un destino: se le da el más lejano para que recorra todo
+        _, distance = self.module.EstadoDijkstra.dijkstra_con_clase_auxiliar(g, source, target)
+        return {target: distance}
+
+
+class ReinsertAVLDijkstra:
+    def __init__(self):
+        self.module = load_module("ejercicio_resuelto_completo",
+                                  "4_APUNTES_DIJKSTRA_CLAUDE/ejercicio_resuelto_completo.py")
+
+    def build(self, csr):
+        g = self.module.Grafo()
+        for u in range(csr.num_nodes()):
+            g.nodos[u] = self.module.NodoGrafo(u)
+        for u, v, w in edges_of(csr):
+            g.nodos[u].agregar_ruta(g.nodos[v], w)
+        return g
+
+    def run(self, g, source, target, stats):
+        search = SearchStats() if stats is not None else None
+        self.module.DijkstraConAVL(g).ejecutar(source, stats=search, verbose=False)
+        if search is not None:
+            stats.update(search.as_dict())
+            del stats["phases"]
+        return {i: n.distancia for i, n in g.nodos.items() if n.distancia != float('inf')}
+
+
+# nombre -> (fábrica del adaptador, máximo de nodos con el que es razonable ejecutarla)
+IMPLEMENTATIONS = {
+    "heapq": (lambda: CoreDijkstra(BinaryHeap), 10 ** 6),
+    "avl": (lambda: CoreDijkstra(AVLTree), 10 ** 6),
+    "avl_decrease": (lambda: CoreDijkstra(AVLTree, decrease_key=True), 10 ** 6),
+    "minheap": (MinHeapDijkstra, 10 ** 6),
+    "avl_reinsert": (ReinsertAVLDijkstra, 10 ** 5),
+    "sorted_list": (SortedListDijkstra, 10 ** 4),
+    "linear_scan": (LinearScanDijkstra, 10 ** 3),
+}
+
+
+# ===========================================================
+#                       MEDICIÓN
+# ===========================================================
+
+def measure(adapter, csr, source, target, reference, repeat):
+    graph = adapter.build(csr)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        distances = adapter.run(graph, source, target, None)
+        best = min(best, time.perf_counter() - start)
+
+    for node, distance in distances.items():
+        if distance != reference[node]:
+            raise AssertionError(f"Distancia incorrecta a {node}: {distance} != {reference[node]}")
+
+    # Contadores y memoria en una pasada aparte: no contaminan el tiempo
+    ops = {}
+    tracemalloc.start()
+    adapter.run(graph, source, target, ops)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, ops
+
+
+def run_suite(max_exponent, implementations, models, seed, repeat, stream=sys.stdout):
+    adapters = {name: IMPLEMENTATIONS[name][0]() for name in implementations}
+    results = []
+    print(f"{'modelo':<12}{'nodos':>9}{'aristas':>10}  {'implementación':<14}"
+          f"{'segundos':>10}{'pico MB':>9}", file=stream)
+
+    for model in models:
+        for exponent in range(2, max_exponent + 1):
+            csr = build_csr(model, 10 ** exponent, seed + exponent)
+            n = csr.num_nodes()
+            source, reference = pick_source(csr)
+            target = max(range(n), key=lambda i: (reference[i] != float('inf'), reference[i]))
+
+            for name, adapter in adapters.items():
+                if n > IMPLEMENTATIONS[name][1]:
+                    continue
+                seconds, peak, ops = measure(adapter, csr, source, target, reference, repeat)
+                results.append({"implementation": name, "model": model, "nodes": n,
+                                "edges": csr.num_edges(), "seconds": seconds,
+                                "peak_bytes": peak, "ops": ops})
+                print(f"{model:<12}{n:>9}{csr.num_edges():>10}  {name:<14}"
+                      f"{seconds:>10.4f}{peak / 2**20:>9.2f}", file=stream)
+    return results
+
+
+# ===========================================================
+#                COMPARACIÓN CON LA REFERENCIA
+# ===========================================================
+
+def regressions(results, baseline, threshold, min_seconds=0.005):
+    # Solo cuentan subidas relativas por encima del umbral y del ruido absoluto
+    previous = {(r["implementation"], r["model"], r["nodes"]): r for r in baseline["results"]}
+    found = []
+    for result in results:
+        old = previous.get((result["implementation"], result["model"], result["nodes"]))
+        if old is None:
+            continue
+        for metric, noise in (("seconds", min_seconds), ("peak_bytes", 64 << 10)):
+            limit = old[metric] * (1 + threshold)
+            if result[metric] > limit and result[metric] - old[metric] > noise:
+                found.append((result, metric, old[metric]))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las implementaciones de Dijkstra")
+    parser.add_argument("--max-exponent", type=int, default=4)
+    parser.add_argument("--implementations", nargs="+", default=list(IMPLEMENTATIONS),
+                        choices=list(IMPLEMENTATIONS))
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="fichero JSON con los resultados")
+    parser.add_argument("--baseline", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="empeoramiento relativo permitido (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))  # AVL y MinHeap recursivos
+    results = run_suite(args.max_exponent, args.implementations, args.models,
+                        args.seed, args.repeat)
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "seed": args.seed, "repeat": args.repeat,
+                 "max_exponent": args.max_exponent},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        found = regressions(results, baseline, args.threshold)
+        for result, metric, old in found:
+            print(f"REGRESIÓN {result['implementation']} / {result['model']} / "
+                  f"{result['nodes']} nodos: {metric} {old:.4g} → {result[metric]:.4g}",
+                  file=sys.stderr)
+        if found:
+            return 1
+        print(f"Sin regresiones por encima del {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
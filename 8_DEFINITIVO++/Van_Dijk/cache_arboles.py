@@ -0,0 +1,121 @@
+import sys
+from array import array
+from collections import OrderedDict
+
+from Djkstra_sin_paja import Graph, Dijkstra
+
+
+# ===========================================================
+#        TDA: CACHÉ LRU DE ÁRBOLES DE CAMINOS MÍNIMOS
+# ===========================================================
+
+def tree_bytes(result):
+    # Estimación: los dos diccionarios más sus claves y valores, y el orden de
+    # fijación (si aún no existe se cuenta el array('i') que creará
+    # topological_order, para que la cuenta no cambie estando en caché)
+    entries = len(result.dist)
+    if result.order is not None:
+        order = sys.getsizeof(result.order)
+    else:
+        order = sys.getsizeof(array('i')) + entries * array('i').itemsize
+    return (sys.getsizeof(result.dist) + sys.getsizeof(result.prev) + order
+            + entries * (2 * sys.getsizeof(0) + sys.getsizeof(0.0)))
+
+
+class ShortestPathTreeCache:
+    def __init__(self, graph, max_entries=128, max_bytes=64 << 20, dijkstra=None):
+        self.graph = graph
+        self.dijkstra = dijkstra if dijkstra is not None else Dijkstra(graph)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # (origen, versión) -> (SearchResult, bytes)
+        self.bytes = 0
+        self.version = graph.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _discard(self, key):
+        _, size = self.entries.pop(key)
+        self.bytes -= size
+
+    def _invalidate_stale(self):
+        # El grafo cambió: ningún árbol de una versión anterior se vuelve a servir
+        for key in [k for k in self.entries if k[1] != self.graph.version]:
+            self._discard(key)
+            self.invalidations += 1
+        self.version = self.graph.version
+
+    def get_tree(self, source_name):
+        if self.version != self.graph.version:
+            self._invalidate_stale()
+
+        key = (source_name, self.graph.version)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        result = self.dijkstra.query(source_name)
+        size = tree_bytes(result)
+        self.entries[key] = (result, size)
+        self.bytes += size
+
+        while self.entries and (len(self.entries) > self.max_entries
+                                or self.bytes > self.max_bytes):
+            oldest = next(iter(self.entries))
+            if oldest == key and len(self.entries) == 1:
+                break  # un árbol mayor que max_bytes se sirve igualmente
+            self._discard(oldest)
+            self.evictions += 1
+        return result
+
+    def get_distance(self, source_name, destination_name):
+        return self.get_tree(source_name).get_distance(destination_name)
+
+    def get_path(self, source_name, destination_name):
+        return self.get_tree(source_name).get_path(destination_name)
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    g = Graph()
+    g.add_edge("A", "B", 4)
+    g.add_edge("A", "C", 2)
+    g.add_edge("C", "B", 1)
+    g.add_edge("B", "D", 5)
+    g.add_edge("C", "D", 8)
+    g.add_edge("C", "E", 10)
+    g.add_edge("D", "E", 2)
+    g.add_edge("D", "F", 6)
+    g.add_edge("E", "F", 3)
+
+    cache = ShortestPathTreeCache(g, max_entries=2)
+    for source, dest in [("A", "F"), ("A", "E"), ("C", "F"), ("D", "F"), ("A", "F")]:
+        print(f"{source} → {dest}: {' → '.join(cache.get_path(source, dest))}")
+
+    g.add_edge("A", "F", 1)  # nueva versión del grafo: el árbol de A ya no vale
+    print(f"A → F tras añadir A-F: {' → '.join(cache.get_path('A', 'F'))}")
+    print(cache.stats())
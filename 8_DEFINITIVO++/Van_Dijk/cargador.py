@@ -0,0 +1,174 @@
+# ===========================================================
+#   CARGA EN STREAMING: DIMACS (.gr), CSV Y LISTAS DE ARISTAS
+# ===========================================================
+#
+# Se lee el fichero por bloques de líneas, los nombres se internan a
+# ids enteros y las aristas se acumulan en arrays compactos; la
+# memoria depende del tamaño del grafo, no del texto del fichero.
+#
+# Uso: python cargador.py fichero [min|sum|last]
+
+import os
+import sys
+import time
+from array import array
+
+from Djkstra_sin_paja import CSRGraph
+
+
+class LoadProgress:
+    def __init__(self, total_bytes):
+        self.total_bytes = total_bytes
+        self.bytes_read = 0
+        self.edges = 0
+        self.start = time.perf_counter()
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def report(self, stream=sys.stderr):
+        elapsed = max(self.elapsed(), 1e-9)
+        percent = 100 * self.bytes_read / self.total_bytes if self.total_bytes else 100
+        print(f"\r{percent:5.1f}%  {self.edges:,} aristas  "
+              f"{self.bytes_read / elapsed / 1e6:.1f} MB/s  "
+              f"{self.edges / elapsed:,.0f} aristas/s", end="", file=stream)
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".gr":
+        return "dimacs"
+    if extension == ".csv":
+        return "csv"
+    return "edgelist"
+
+
+class _Builder:
+    # Interna nombres y acumula aristas sin tuplas intermedias
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.sources = array('i')
+        self.targets = array('i')
+        self.weights = array('d')
+        self.header_candidate = None  # línea 1 "from,to" a la espera de la siguiente
+
+    def intern(self, name):
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return node_id
+
+    def add(self, source, target, weight):
+        self.sources.append(self.intern(source))
+        self.targets.append(self.intern(target))
+        self.weights.append(weight)
+
+
+def _parse_dimacs(lines, builder, line_number):
+    for line in lines:
+        line_number += 1
+        if line.startswith("a "):
+            _, u, v, w = line.split()
+            builder.add(int(u), int(v), float(w))
+        elif line.startswith("p "):
+            # Los vértices 1..n existen aunque no tengan aristas
+            for node in range(1, int(line.split()[2]) + 1):
+                builder.intern(node)
+        elif line.strip() and not line.startswith("c"):
+            raise ValueError(f"Línea DIMACS {line_number} no válida: {line.strip()!r}")
+    return line_number
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_rows(lines, builder, line_number, delimiter, header):
+    for line in lines:
+        line_number += 1
+        if line_number == 1 and header:
+            continue
+        fields = line.split(delimiter) if delimiter else line.split()
+        if not fields or not fields[0].strip() or fields[0].startswith("#"):
+            continue
+        if len(fields) < 2:
+            raise ValueError(f"Línea {line_number} no válida: {line.strip()!r}")
+        numeric = _is_number(fields[0]) and _is_number(fields[1])
+        if line_number == 1 and header is None and len(fields) == 2 and not numeric:
+            # Sin peso que delate la cabecera: decide la primera arista de datos
+            builder.header_candidate = fields
+            continue
+        if builder.header_candidate is not None:
+            if not numeric:
+                candidate = builder.header_candidate
+                builder.add(candidate[0].strip(), candidate[1].strip(), 1.0)
+            builder.header_candidate = None
+        try:
+            weight = float(fields[2]) if len(fields) > 2 else 1.0
+        except ValueError:
+            if line_number == 1 and header is None:
+                continue  # cabecera detectada por su peso no numérico
+            raise ValueError(f"Peso no numérico en la línea {line_number}: {line.strip()!r}")
+        builder.add(fields[0].strip(), fields[1].strip(), weight)
+    return line_number
+
+
+def load_graph(path, fmt=None, dedupe="min", chunk_size=1 << 20, progress=None, header=None):
+    # progress: None, True (informe por stderr) o callable(LoadProgress)
+    # header (csv y listas): True/False fuerzan si la línea 1 es cabecera; None la
+    # detecta si su peso no es numérico o, sin peso, si sus extremos no son
+    # numéricos y los de la siguiente arista sí ("from,to" seguido de "1,2")
+    fmt = fmt or detect_format(path)
+    if fmt not in ("dimacs", "csv", "edgelist"):
+        raise ValueError(f"Formato '{fmt}' desconocido")
+    if progress is True:
+        progress = LoadProgress.report
+
+    builder = _Builder()
+    status = LoadProgress(os.path.getsize(path))
+    line_number = 0
+
+    # En binario para contar bytes reales (getsize) y no caracteres decodificados
+    with open(path, "rb") as f:
+        while True:
+            raw = f.readlines(chunk_size)
+            if not raw:
+                break
+            lines = [line.decode("utf-8") for line in raw]
+            if fmt == "dimacs":
+                line_number = _parse_dimacs(lines, builder, line_number)
+            else:
+                delimiter = "," if fmt == "csv" else None
+                line_number = _parse_rows(lines, builder, line_number, delimiter, header)
+            status.bytes_read += sum(map(len, raw))
+            status.edges = len(builder.sources)
+            if progress:
+                progress(status)
+
+    if progress is LoadProgress.report:
+        print(file=sys.stderr)
+    if builder.header_candidate is not None:
+        # Fichero de una sola arista: se conserva
+        candidate = builder.header_candidate
+        builder.add(candidate[0].strip(), candidate[1].strip(), 1.0)
+
+    csr = CSRGraph.from_edges(builder.names, builder.sources, builder.targets,
+                              builder.weights, dedupe)
+    return csr, status
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python cargador.py fichero [min|sum|last]")
+        sys.exit(1)
+
+    policy = sys.argv[2] if len(sys.argv) > 2 else "min"
+    graph, status = load_graph(sys.argv[1], dedupe=policy, progress=True)
+    print(f"{graph.num_nodes():,} nodos, {graph.num_edges():,} aristas "
+          f"({status.edges:,} leídas) en {status.elapsed():.2f} s")
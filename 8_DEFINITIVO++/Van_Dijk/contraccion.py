@@ -0,0 +1,277 @@
+import heapq
+import pickle
+
+from Djkstra_sin_paja import Graph, GraphEdge, AVLTree, Dijkstra
+
+
+# ===========================================================
+#                 TDA: SHORTCUT (ATAJO)
+# ===========================================================
+
+class Shortcut(GraphEdge):
+    # Atajo source -> destination que sustituye a source -> via -> destination
+    def __init__(self, source, destination, weight, via):
+        super().__init__(source, destination, weight)
+        self.via = via
+
+
+# ===========================================================
+#            TDA: CONTRACTION HIERARCHY
+# ===========================================================
+
+class ContractionHierarchy:
+    FORMAT_VERSION = 1
+
+    def __init__(self, rank, edges, queue=AVLTree):
+        # rank: nombre -> orden de contracción
+        # edges: (origen, destino) -> (peso, via); via es None si es arista original
+        self.rank = rank
+        self.edges = edges
+        self.queue = queue
+        self.up = Graph()    # aristas u -> w con rank[u] < rank[w]
+        self.down = Graph()  # aristas u -> w con rank[u] > rank[w], invertidas
+        for name in rank:
+            self.up.add_node(name)
+            self.down.add_node(name)
+        for (u, w), (weight, via) in edges.items():
+            if rank[u] < rank[w]:
+                self._link(self.up, u, w, weight, via)
+            else:
+                self._link(self.down, w, u, weight, via)
+        self.settled = 0
+
+    @staticmethod
+    def _link(graph, source_name, destination_name, weight, via):
+        source = graph.get_node(source_name)
+        destination = graph.get_node(destination_name)
+        if via is None:
+            source.add_edge(destination, weight)
+        else:
+            source.append_edge(Shortcut(source, destination, weight, via))
+
+    # -------------------- Preprocesado --------------------
+
+    @classmethod
+    def preprocess(cls, graph, witness_limit=50, queue=AVLTree):
+        out = {name: {} for name in graph.nodes}
+        inc = {name: {} for name in graph.nodes}
+        edges = {}
+
+        for node in graph.nodes.values():
+            for edge in node.edges:
+                u, w = node.name, edge.destination.name
+                if u == w:
+                    continue
+                if edge.weight < out[u].get(w, float('inf')):
+                    out[u][w] = edge.weight
+                    inc[w][u] = edge.weight
+                    edges[(u, w)] = (edge.weight, None)
+
+        contracted = set()
+        deleted_neighbors = {name: 0 for name in graph.nodes}
+
+        def witness(u, v, limit):
+            # Dijkstra local desde u sin pasar por v ni por nodos contraídos
+            dist = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < witness_limit:
+                d, x = heapq.heappop(heap)
+                if d > dist[x]:
+                    continue
+                if d > limit:
+                    break
+                settled += 1
+                for y, weight in out[x].items():
+                    if y == v or y in contracted:
+                        continue
+                    nd = d + weight
+                    if nd < dist.get(y, float('inf')):
+                        dist[y] = nd
+                        heapq.heappush(heap, (nd, y))
+            return dist
+
+        def shortcuts_for(v):
+            needed = []
+            outs = [(w, c) for w, c in out[v].items() if w not in contracted]
+            if not outs:
+                return needed
+            max_out = max(c for _, c in outs)
+            for u, c_in in inc[v].items():
+                if u in contracted:
+                    continue
+                dist = witness(u, v, c_in + max_out)
+                for w, c_out in outs:
+                    if w != u and dist.get(w, float('inf')) > c_in + c_out:
+                        needed.append((u, w, c_in + c_out))
+            return needed
+
+        def importance(v):
+            degree = (sum(1 for u in inc[v] if u not in contracted)
+                      + sum(1 for w in out[v] if w not in contracted))
+            return len(shortcuts_for(v)) - degree + deleted_neighbors[v]
+
+        heap = [(importance(v), v) for v in graph.nodes]
+        heapq.heapify(heap)
+        rank = {}
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if v in contracted:
+                continue
+            # Actualización perezosa: si su importancia ha crecido, vuelve a la cola
+            priority = importance(v)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out[u].get(w, float('inf')):
+                    out[u][w] = weight
+                    inc[w][u] = weight
+                    edges[(u, w)] = (weight, v)
+
+            rank[v] = len(rank)
+            contracted.add(v)
+            for neighbor in set(inc[v]) | set(out[v]):
+                deleted_neighbors[neighbor] += 1
+
+        return cls(rank, edges, queue)
+
+    # -------------------- Consultas --------------------
+
+    def _search(self, source_name, target_name):
+        if source_name not in self.rank:
+            raise ValueError(f"Nodo '{source_name}' no existe")
+        if target_name not in self.rank:
+            raise ValueError(f"Nodo '{target_name}' no existe")
+
+        starts = (self.up.get_node(source_name), self.down.get_node(target_name))
+        dist = ({source_name: 0}, {target_name: 0})
+        parent = ({source_name: None}, {target_name: None})
+        queues = [self.queue(), self.queue()]
+        queues[0].insert(0, starts[0])
+        queues[1].insert(0, starts[1])
+
+        best = float('inf')
+        meeting = None
+        self.settled = 0
+
+        # Ambas búsquedas solo suben de rango; cada una se poda al superar best
+        while not queues[0].is_empty() or not queues[1].is_empty():
+            for side in (0, 1):
+                pq = queues[side]
+                if pq.is_empty():
+                    continue
+                if pq.min_key() >= best:
+                    queues[side] = self.queue()
+                    continue
+                d, node = pq.extract_min()
+                if d > dist[side][node.name]:
+                    continue
+                self.settled += 1
+
+                other = dist[1 - side].get(node.name)
+                if other is not None and d + other < best:
+                    best = d + other
+                    meeting = node.name
+
+                for edge in node.edges:
+                    name = edge.destination.name
+                    new_dist = d + edge.weight
+                    if new_dist < dist[side].get(name, float('inf')):
+                        dist[side][name] = new_dist
+                        parent[side][name] = node.name
+                        pq.insert(new_dist, edge.destination)
+
+        return best, meeting, parent
+
+    def distance(self, source_name, target_name):
+        return self._search(source_name, target_name)[0]
+
+    def shortest_path(self, source_name, target_name):
+        best, meeting, parent = self._search(source_name, target_name)
+        if meeting is None:
+            return float('inf'), []
+
+        packed = []
+        current = meeting
+        while current is not None:
+            packed.append(current)
+            current = parent[0][current]
+        packed.reverse()
+        current = parent[1][meeting]
+        while current is not None:
+            packed.append(current)
+            current = parent[1][current]
+
+        return best, self._unpack(packed)
+
+    def _unpack(self, packed):
+        path = [packed[0]]
+        for u, w in zip(packed, packed[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                via = self.edges[(a, b)][1]
+                if via is None:
+                    path.append(b)
+                else:
+                    stack.append((via, b))
+                    stack.append((a, via))
+        return path
+
+    # -------------------- Persistencia --------------------
+
+    def save(self, path):
+        data = {
+            "version": self.FORMAT_VERSION,
+            "rank": self.rank,
+            "edges": self.edges,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path, queue=AVLTree):
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Versión de jerarquía no soportada: {data.get('version')}")
+        return cls(data["rank"], data["edges"], queue)
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    g = Graph()
+    g.add_edge("A", "B", 4)
+    g.add_edge("A", "C", 2)
+    g.add_edge("C", "B", 1)
+    g.add_edge("B", "D", 5)
+    g.add_edge("C", "D", 8)
+    g.add_edge("C", "E", 10)
+    g.add_edge("D", "E", 2)
+    g.add_edge("D", "F", 6)
+    g.add_edge("E", "F", 3)
+
+    ch = ContractionHierarchy.preprocess(g)
+    shortcuts = sum(1 for _, via in ch.edges.values() if via is not None)
+    print(f"Orden de contracción: {sorted(ch.rank, key=ch.rank.get)}")
+    print(f"Atajos añadidos: {shortcuts}\n")
+
+    path_file = os.path.join(tempfile.gettempdir(), "jerarquia.ch")
+    ch.save(path_file)
+    ch = ContractionHierarchy.load(path_file)
+
+    dijkstra = Dijkstra(g)
+    dijkstra.run("A")
+    for dest in ["B", "C", "D", "E", "F"]:
+        distance, path = ch.shortest_path("A", dest)
+        assert distance == dijkstra.get_distance(dest)
+        print(f"A → {dest}: {' → '.join(path)} (distancia: {distance})")
@@ -0,0 +1,301 @@
+import math
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Djkstra_sin_paja import Graph, CSRGraph, Dijkstra
+
+
+# ===========================================================
+#      RELAJACIONES EN PARALELO (POR PARTICIÓN DE NODOS)
+# ===========================================================
+#
+# Cada nodo v pertenece a la partición v % partes. La partición p guarda
+# solo las aristas que llegan a sus nodos (separadas en ligeras y pesadas)
+# y es la única que escribe dist[v] y prev[v] de esos nodos, así que los
+# trabajadores escriben directamente en la memoria compartida sin
+# conflictos. A cada fase solo viajan (partición, pesadas, tamaño de la
+# frontera) y la lista de nodos mejorados.
+
+_worker_state = None
+
+
+def _attach(name, typecode):
+    # El segmento lo crea y lo libera el proceso principal (close())
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf.cast(typecode)
+
+
+def _init_worker(part_names, names):
+    global _worker_state
+    segments = []
+
+    def view(name, typecode):
+        shm, data = _attach(name, typecode)
+        segments.append(shm)
+        return data
+
+    parts = [[tuple(view(name, typecode) for name, typecode in kind) for kind in part]
+             for part in part_names]
+    dist, prev, frontier = (view(name, typecode) for name, typecode in names)
+    _worker_state = (segments, parts, dist, prev, frontier)
+
+
+def _relax(offsets, targets, weights, dist, prev, frontier, count):
+    # Relaja las aristas de la frontera hacia los nodos de una partición
+    improved = []
+    for k in range(count):
+        u = frontier[k]
+        du = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            new_dist = du + weights[i]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+                improved.append(v)
+    return improved
+
+
+def _worker_relax(task):
+    part, heavy, count = task
+    _, parts, dist, prev, frontier = _worker_state
+    return _relax(*parts[part][heavy], dist, prev, frontier, count)
+
+
+def _partition(csr, delta, parts):
+    # parts × (ligeras, pesadas) subgrafos CSR con las aristas que llegan a cada partición
+    n = csr.num_nodes()
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    tables = [[(array('q', [0]), array('i'), array('d')) for _ in range(2)]
+              for _ in range(parts)]
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            w = weights[i]
+            _, part_targets, part_weights = tables[v % parts][w > delta]
+            part_targets.append(v)
+            part_weights.append(w)
+        for part in tables:
+            for part_offsets, part_targets, _ in part:
+                part_offsets.append(len(part_targets))
+    return tables
+
+
+def _release(pool, views, segments):
+    pool.shutdown()
+    for data in views:
+        data.release()
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+# ===========================================================
+#             TDA: DELTA-STEPPING SSSP
+# ===========================================================
+
+def auto_delta(csr):
+    # Meyer y Sanders: delta ~ peso máximo / grado medio
+    n, m = csr.num_nodes(), csr.num_edges()
+    if m == 0:
+        return 1.0
+    max_weight = max(csr.weights)
+    positive = [w for w in csr.weights if w > 0]
+    if not positive:
+        return 1.0
+    delta = max_weight / max(1.0, m / max(1, n))
+    return max(delta, min(positive))
+
+
+class DeltaStepping:
+    # Con workers > 1 solo se reparten las fases con al menos parallel_threshold
+    # nodos en la frontera; cada fase paga un viaje de ida y vuelta al pool, así
+    # que por debajo el proceso principal relaja él mismo las particiones. En
+    # CPython el modo en serie (workers=1, el de por defecto) suele ganar: mídase
+    # con el grafo real antes de subir workers.
+    def __init__(self, graph, delta=None, workers=1, parallel_threshold=65536):
+        self.csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        self.delta = delta if delta is not None else auto_delta(self.csr)
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.dist = array('d')
+        self.prev = array('i')
+        self._parts = None
+        self._pool = None
+        self._shared = None
+        self._finalizer = None
+
+    # -------------------- Memoria compartida --------------------
+
+    def _share(self, data, typecode, views, segments):
+        raw = array(typecode, data).tobytes()
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(raw)))
+        shm.buf[:len(raw)] = raw
+        segments.append(shm)
+        view = shm.buf[:len(raw)].cast(typecode)
+        views.append(view)
+        return shm.name, view
+
+    def _start_pool(self):
+        n = self.csr.num_nodes()
+        views, segments = [], []
+        part_names, parts = [], []
+        for part in _partition(self.csr, self.delta, self.workers):
+            kinds, kind_names = [], []
+            for offsets, targets, weights in part:
+                shared = [self._share(data, typecode, views, segments) for data, typecode in
+                          ((offsets, 'q'), (targets, 'i'), (weights, 'd'))]
+                kind_names.append([(name, typecode) for (name, _), typecode
+                                   in zip(shared, 'qid')])
+                kinds.append(tuple(data for _, data in shared))
+            part_names.append(kind_names)
+            parts.append(kinds)
+
+        names = []
+        shared = []
+        for data, typecode in ((array('d', [float('inf')]) * n, 'd'),
+                               (array('i', [-1]) * n, 'i'),
+                               (array('i', [0]) * n, 'i')):
+            name, data = self._share(data, typecode, views, segments)
+            names.append((name, typecode))
+            shared.append(data)
+
+        self._parts = parts
+        self._shared = tuple(shared)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=(part_names, names))
+        # Si no se llama a close(), los segmentos se liberan al recoger el objeto
+        self._finalizer = weakref.finalize(self, _release, self._pool, views, segments)
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._pool = None
+        self._shared = None
+        self._parts = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------- Algoritmo --------------------
+
+    def _phase(self, dist, prev, frontier, heavy):
+        # Devuelve los nodos cuya distancia ha mejorado (puede haber repetidos)
+        parts = self._parts
+        if self._pool is None or len(frontier) < self.parallel_threshold:
+            improved = []
+            for part in parts:
+                improved.extend(_relax(*part[heavy], dist, prev, frontier, len(frontier)))
+            return improved
+        shared_frontier = self._shared[2]
+        shared_frontier[:len(frontier)] = array('i', frontier)
+        tasks = [(p, heavy, len(frontier)) for p in range(len(parts))]
+        improved = []
+        for batch in self._pool.map(_worker_relax, tasks):
+            improved.extend(batch)
+        return improved
+
+    def run(self, start_name):
+        start = self.csr.id_of(start_name)
+        if start is None:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+        self.run_id(start)
+
+    def run_id(self, start):
+        n = self.csr.num_nodes()
+        if self.workers > 1 and self._pool is None:
+            self._start_pool()
+        if self._pool is not None:
+            # Vistas compartidas en las que escriben los trabajadores
+            dist, prev, _ = self._shared
+            dist[:] = array('d', [float('inf')]) * n
+            prev[:] = array('i', [-1]) * n
+        else:
+            if self._parts is None:
+                self._parts = _partition(self.csr, self.delta, 1)
+            dist = [float('inf')] * n
+            prev = [-1] * n
+
+        delta = self.delta
+        buckets = {}
+        bucket_of = [-1] * n  # cubeta en la que está cada nodo (-1: en ninguna)
+
+        def place(improved):
+            for v in improved:
+                i = math.floor(dist[v] / delta)
+                old = bucket_of[v]
+                if old != i:
+                    if old != -1:
+                        buckets[old].discard(v)
+                    bucket_of[v] = i
+                    buckets.setdefault(i, set()).add(v)
+
+        dist[start] = 0.0
+        place([start])
+
+        while buckets:
+            i = min(buckets)
+            settled = []
+            # Fase ligera: se repite mientras la cubeta i se vuelva a llenar
+            while buckets.get(i):
+                frontier = list(buckets.pop(i))
+                for v in frontier:
+                    bucket_of[v] = -1
+                settled.extend(frontier)
+                place(self._phase(dist, prev, frontier, heavy=False))
+            buckets.pop(i, None)
+            # Fase pesada: una sola vez con todos los nodos fijados en la cubeta
+            place(self._phase(dist, prev, settled, heavy=True))
+            for key in [k for k, nodes in buckets.items() if not nodes]:
+                del buckets[key]
+
+        self.dist = array('d', dist)
+        self.prev = array('i', prev)
+
+    def get_distance(self, destination_name):
+        node_id = self.csr.id_of(destination_name)
+        return self.dist[node_id] if node_id is not None else float('inf')
+
+    def get_path(self, destination_name):
+        dest = self.csr.id_of(destination_name)
+        if dest is None or self.dist[dest] == float('inf'):
+            return []
+
+        path = []
+        current = dest
+        while current != -1:
+            path.append(self.csr.names[current])
+            current = self.prev[current]
+        return path[::-1]
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(3)
+    g = Graph()
+    n = 5000
+    for u in range(n):
+        g.add_node(u)
+    for u in range(n):
+        for _ in range(4):
+            g.add_edge(u, rng.randrange(n), rng.randint(1, 100))
+
+    dijkstra = Dijkstra(g)
+    dijkstra.run(0)
+
+    with DeltaStepping(g, workers=2, parallel_threshold=64) as engine:
+        engine.run(0)
+        assert all(engine.get_distance(name) == dijkstra.get_distance(name) for name in g.nodes)
+        print(f"delta = {engine.delta:.2f}: {n} distancias idénticas a Dijkstra")
+        print(f"0 → {n - 1}: {engine.get_path(n - 1)} (distancia: {engine.get_distance(n - 1)})")
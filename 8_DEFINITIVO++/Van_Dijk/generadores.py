@@ -0,0 +1,225 @@
+# ===========================================================
+#        GENERADORES DE GRAFOS ALEATORIOS CON SEMILLA
+# ===========================================================
+#
+# Erdős–Rényi G(n, m), Barabási–Albert, rejilla tipo callejero y
+# geométrico aleatorio. Las aristas se escriben directamente en arrays
+# (sources, targets, weights) que CSRGraph.from_edges consume en bloque.
+#
+# Los modelos por bloques (G(n, m), rejilla, geométrico) reparten el
+# rango de nodos en trozos de chunk_nodes con semilla propia: el
+# resultado es el mismo con 1 o con N procesos.
+#
+# Uso: python generadores.py [modelo] [nodos] [procesos]
+
+import math
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from Djkstra_sin_paja import CSRGraph
+
+CHUNK_NODES = 1 << 14
+
+
+# ===========================================================
+#            TROZOS DE ARISTAS (POR PROCESO TRABAJADOR)
+# ===========================================================
+
+# (modelo, parámetros de solo lectura) fijados una vez en el initializer
+_worker_state = None
+
+
+def _init_worker(model, params):
+    global _worker_state
+    if model == "geometric":
+        # Cada trabajador indexa los puntos por celdas una sola vez
+        xs, ys, radius = params
+        cells = {}
+        for i in range(len(xs)):
+            cells.setdefault((int(xs[i] / radius), int(ys[i] / radius)), []).append(i)
+        params = (xs, ys, radius, cells)
+    _worker_state = (model, params)
+
+
+def _chunk_rng(seed, lo):
+    return random.Random((seed << 32) ^ lo)
+
+
+def _erdos_renyi_chunk(params, lo, hi, count, out):
+    # count pares distintos de las filas [lo, hi), muestreados sin reemplazo
+    n, seed, max_weight = params
+    sources, targets, weights = out
+    rng = _chunk_rng(seed, lo)
+    for k in rng.sample(range((hi - lo) * (n - 1)), count):
+        u, r = divmod(k, n - 1)
+        u += lo
+        sources.append(u)
+        targets.append(r + (r >= u))  # se salta el bucle u -> u
+        weights.append(rng.randint(1, max_weight))
+
+
+def _grid_chunk(params, lo, hi, count, out):
+    # Calles de doble sentido hacia la derecha y hacia abajo de cada cruce
+    rows, cols, seed, max_weight = params
+    sources, targets, weights = out
+    rng = _chunk_rng(seed, lo)
+    for u in range(lo, hi):
+        r, c = divmod(u, cols)
+        if c + 1 < cols:
+            w = rng.randint(1, max_weight)
+            sources.extend((u, u + 1))
+            targets.extend((u + 1, u))
+            weights.extend((w, w))
+        if r + 1 < rows:
+            w = rng.randint(1, max_weight)
+            sources.extend((u, u + cols))
+            targets.extend((u + cols, u))
+            weights.extend((w, w))
+
+
+def _geometric_chunk(params, lo, hi, count, out):
+    # Pares i < j a distancia <= radius; peso = distancia en milésimas
+    xs, ys, radius, cells = params
+    sources, targets, weights = out
+    for i in range(lo, hi):
+        x, y = xs[i], ys[i]
+        cx, cy = int(x / radius), int(y / radius)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    if j > i:
+                        d = math.hypot(x - xs[j], y - ys[j])
+                        if d <= radius:
+                            w = int(d * 1000) + 1
+                            sources.extend((i, j))
+                            targets.extend((j, i))
+                            weights.extend((w, w))
+
+
+_CHUNKS = {
+    "erdos_renyi": _erdos_renyi_chunk,
+    "grid": _grid_chunk,
+    "geometric": _geometric_chunk,
+}
+
+
+def _generate_chunk(task):
+    lo, hi, count = task
+    model, params = _worker_state
+    out = (array('i'), array('i'), array('d'))
+    _CHUNKS[model](params, lo, hi, count, out)
+    return out
+
+
+def _run_chunks(model, params, tasks, workers):
+    sources, targets, weights = array('i'), array('i'), array('d')
+    # Se concatenan en el orden de los trozos: mismo resultado con cualquier workers
+    if workers <= 1:
+        _init_worker(model, params)
+        _concat(map(_generate_chunk, tasks), sources, targets, weights)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(model, params)) as pool:
+            _concat(pool.map(_generate_chunk, tasks), sources, targets, weights)
+    return sources, targets, weights
+
+
+def _concat(results, sources, targets, weights):
+    for chunk_sources, chunk_targets, chunk_weights in results:
+        sources.extend(chunk_sources)
+        targets.extend(chunk_targets)
+        weights.extend(chunk_weights)
+
+
+def _ranges(n, chunk_nodes):
+    return [(lo, min(lo + chunk_nodes, n)) for lo in range(0, n, chunk_nodes)]
+
+
+# ===========================================================
+#                       MODELOS
+# ===========================================================
+#
+# Todos devuelven (nodos, sources, targets, weights) con ids 0..nodos-1
+
+def erdos_renyi(n, m, seed=0, max_weight=100, workers=1, chunk_nodes=CHUNK_NODES):
+    # G(n, m) dirigido sin bucles ni aristas repetidas; m se reparte entre los
+    # bloques de filas en proporción a sus pares posibles (muestreo estratificado)
+    total = max(0, n) * max(0, n - 1)
+    if n < 0 or m < 0 or m > total:
+        raise ValueError(f"G({n}, {m}) imposible: como mucho {total} aristas")
+    ranges = _ranges(n, chunk_nodes)
+    # Con 0 o 1 nodos no hay pares posibles (total == 0): solo vale m == 0
+    counts = [m * (hi - lo) * (n - 1) // total if total else 0 for lo, hi in ranges]
+    for i in range(m - sum(counts)):
+        counts[i] += 1
+    tasks = [(lo, hi, count) for (lo, hi), count in zip(ranges, counts)]
+    return (n,) + _run_chunks("erdos_renyi", (n, seed, max_weight), tasks, workers)
+
+
+def grid(rows, cols=None, seed=0, max_weight=100, workers=1, chunk_nodes=CHUNK_NODES):
+    cols = cols if cols is not None else rows
+    n = rows * cols
+    tasks = [(lo, hi, 0) for lo, hi in _ranges(n, chunk_nodes)]
+    return (n,) + _run_chunks("grid", (rows, cols, seed, max_weight), tasks, workers)
+
+
+def random_geometric(n, degree=6, seed=0, workers=1, chunk_nodes=CHUNK_NODES):
+    # Puntos en el cuadrado unidad; radio elegido para un grado medio ~ degree
+    radius = math.sqrt(degree / (math.pi * n))
+    rng = random.Random(seed)
+    xs = array('d', (rng.random() for _ in range(n)))
+    ys = array('d', (rng.random() for _ in range(n)))
+    tasks = [(lo, hi, 0) for lo, hi in _ranges(n, chunk_nodes)]
+    return (n,) + _run_chunks("geometric", (xs, ys, radius), tasks, workers)
+
+
+def barabasi_albert(n, m=2, seed=0, max_weight=100):
+    # Enlace preferencial: cada nodo nuevo se une a m nodos elegidos según su grado.
+    # Es secuencial por naturaleza: no admite trozos en paralelo
+    if n <= m:
+        raise ValueError(f"Barabási-Albert necesita más de {m} nodos")
+    rng = random.Random(seed)
+    sources, targets, weights = array('i'), array('i'), array('d')
+    repeated = array('i', range(m))  # cada nodo aparece tantas veces como su grado
+    for u in range(m, n):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(repeated[rng.randrange(len(repeated))])
+        for v in sorted(chosen):
+            w = rng.randint(1, max_weight)
+            sources.extend((u, v))
+            targets.extend((v, u))
+            weights.extend((w, w))
+            repeated.extend((u, v))
+    return n, sources, targets, weights
+
+
+def to_csr(edges, dedupe=None):
+    n, sources, targets, weights = edges
+    return CSRGraph.from_edges(list(range(n)), sources, targets, weights, dedupe)
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    model = sys.argv[1] if len(sys.argv) > 1 else "erdos_renyi"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    builders = {
+        "erdos_renyi": lambda: erdos_renyi(n, 10 * n, workers=workers),
+        "grid": lambda: grid(round(math.sqrt(n)), workers=workers),
+        "geometric": lambda: random_geometric(n, workers=workers),
+        "barabasi_albert": lambda: barabasi_albert(n),
+    }
+    start = time.perf_counter()
+    edges = builders[model]()
+    generated = time.perf_counter() - start
+    csr = to_csr(edges)
+    print(f"{model}: {csr.num_nodes():,} nodos, {csr.num_edges():,} aristas "
+          f"(generación {generated:.2f} s, CSR {time.perf_counter() - start - generated:.2f} s)")
@@ -0,0 +1,88 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from Djkstra_sin_paja import Graph, CSRGraph, DijkstraCSR, SearchWorkspace
+
+
+# ===========================================================
+#       ISÓCRONA POR ORIGEN (POR PROCESO TRABAJADOR)
+# ===========================================================
+
+# Motor y workspace de cada trabajador: se reservan una vez en el initializer
+_worker_state = None
+
+
+def _init_worker(csr, budget):
+    global _worker_state
+    _worker_state = (DijkstraCSR(csr), SearchWorkspace(csr.num_nodes()), budget)
+
+
+def _isochrone(origin_id):
+    engine, workspace, budget = _worker_state
+    return engine.isochrone_id(origin_id, budget, workspace)
+
+
+# ===========================================================
+#                 API: ISÓCRONAS EN LOTE
+# ===========================================================
+
+def iter_isochrones(graph, origins, budget, workers=1, chunksize=16):
+    # Genera (i, Isochrone) en el orden de origins; los ids son los del CSR
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    origin_ids = []
+    for name in origins:
+        node_id = csr.id_of(name)
+        if node_id is None:
+            raise ValueError(f"Nodo '{name}' no existe")
+        origin_ids.append(node_id)
+
+    if workers <= 1:
+        _init_worker(csr, budget)
+        for i, origin_id in enumerate(origin_ids):
+            yield i, _isochrone(origin_id)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(csr, budget)) as pool:
+        for i, isochrone in enumerate(pool.map(_isochrone, origin_ids, chunksize=chunksize)):
+            yield i, isochrone
+
+
+def isochrones(graph, origins, budget, workers=1, chunksize=16):
+    return [isochrone for _, isochrone in
+            iter_isochrones(graph, origins, budget, workers, chunksize)]
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    import random
+
+    from Djkstra_sin_paja import Dijkstra
+
+    rng = random.Random(5)
+    g = Graph()
+    n = 3000
+    for u in range(n):
+        g.add_node(u)
+    for u in range(n):
+        for _ in range(4):
+            g.add_edge(u, rng.randrange(n), rng.randint(1, 100))
+
+    budget = 150
+    origins = rng.sample(range(n), 40)
+    zones = isochrones(g, origins, budget, workers=2)
+
+    dijkstra = Dijkstra(g)
+    for origin, zone in zip(origins, zones):
+        tree = dijkstra.query(origin)
+        expected = {i for i, d in tree.dist.items() if d <= budget}
+        assert set(zone.nodes) == expected
+        assert all(tree.dist[i] == d for i, d in zip(zone.nodes, zone.distances))
+        assert all(v not in expected for v in zone.boundary_to)
+    print(f"{len(origins)} isócronas de presupuesto {budget} idénticas a Dijkstra.query")
+
+    zone = dijkstra.isochrone(origins[0], budget)
+    print(f"Origen {origins[0]}: {len(zone)} nodos alcanzables, "
+          f"{len(zone.boundary_from)} aristas frontera")
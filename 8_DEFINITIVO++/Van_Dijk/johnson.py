@@ -0,0 +1,222 @@
+from array import array
+from collections import deque
+
+from Djkstra_sin_paja import Graph, CSRGraph, DijkstraCSR
+from matriz_distancias import DistanceMatrix, iter_distance_rows
+
+
+# ===========================================================
+#       BELLMAN-FORD (SPFA) CON DETECCIÓN DE CICLOS
+# ===========================================================
+
+class NegativeCycleError(ValueError):
+    def __init__(self, cycle, weight=None):
+        total = f" (peso {weight:g})" if weight is not None else ""
+        super().__init__(f"Ciclo negativo{total}: {' → '.join(map(str, cycle))}")
+        self.cycle = cycle  # nombres, el primero repetido al final
+        self.weight = weight
+
+
+def _parent_cycle(prev, start):
+    # Todo ciclo en el grafo de predecesores de un algoritmo de corrección
+    # de etiquetas tiene peso negativo (Tarjan): sirve de testigo
+    position = {}
+    walk = []
+    current = start
+    while current != -1 and current not in position:
+        position[current] = len(walk)
+        walk.append(current)
+        current = prev[current]
+    if current == -1:
+        return None
+    cycle = walk[position[current]:][::-1]
+    return cycle + cycle[:1]
+
+
+class BellmanFord:
+    def __init__(self, graph):
+        self.csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        self.dist = array('d')
+        self.prev = array('i')
+        self.relaxations = 0
+
+    def run(self, start_name=None):
+        # Sin origen: origen virtual unido con peso 0 a todos los nodos (potenciales de Johnson)
+        if start_name is None:
+            self.run_id(None)
+            return
+        start = self.csr.id_of(start_name)
+        if start is None:
+            raise ValueError(f"Nodo '{start_name}' no existe")
+        self.run_id(start)
+
+    def run_id(self, start):
+        n = self.csr.num_nodes()
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+        prev = array('i', [-1]) * n
+        length = array('i', [0]) * n  # aristas del camino actual hasta cada nodo
+        queued = bytearray(n)
+
+        if start is None:
+            dist = array('d', [0.0]) * n
+            queue = deque(range(n))
+            queued[:] = b"\x01" * n
+        else:
+            dist = array('d', [float('inf')]) * n
+            dist[start] = 0
+            queue = deque([start])
+            queued[start] = 1
+        self.relaxations = 0
+
+        while queue:
+            u = queue.popleft()
+            queued[u] = 0
+            du = dist[u]
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_dist = du + weights[i]
+
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    prev[v] = u
+                    length[v] = length[u] + 1
+                    self.relaxations += 1
+                    # Un camino simple tiene como mucho n - 1 aristas
+                    if length[v] >= n:
+                        cycle = _parent_cycle(prev, v)
+                        if cycle is not None:
+                            raise NegativeCycleError([self.csr.names[x] for x in cycle],
+                                                     self._cycle_weight(cycle))
+                    if not queued[v]:
+                        queued[v] = 1
+                        queue.append(v)
+
+        self.dist = dist
+        self.prev = prev
+
+    def _cycle_weight(self, cycle):
+        # Con aristas paralelas cuenta la más barata de cada tramo
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+        return sum(min(weights[i] for i in range(offsets[u], offsets[u + 1]) if targets[i] == v)
+                   for u, v in zip(cycle, cycle[1:]))
+
+    def get_distance(self, destination_name):
+        node_id = self.csr.id_of(destination_name)
+        return self.dist[node_id] if node_id is not None else float('inf')
+
+    def get_path(self, destination_name):
+        dest = self.csr.id_of(destination_name)
+        if dest is None or self.dist[dest] == float('inf'):
+            return []
+
+        path = []
+        current = dest
+        while current != -1:
+            path.append(self.csr.names[current])
+            current = self.prev[current]
+        return path[::-1]
+
+
+# ===========================================================
+#        TDA: JOHNSON (REPONDERACIÓN + DIJKSTRA)
+# ===========================================================
+
+class Johnson:
+    def __init__(self, graph):
+        self.csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+
+        # h(v) = distancia desde el origen virtual; lanza NegativeCycleError si hay ciclos
+        bellman_ford = BellmanFord(self.csr)
+        bellman_ford.run()
+        self.potential = bellman_ford.dist
+
+        # w'(u, v) = w + h(u) - h(v) >= 0; se recorta el error de redondeo
+        h, offsets, targets = self.potential, self.csr.offsets, self.csr.targets
+        weights = array('d', bytes(8 * self.csr.num_edges()))
+        for u in range(self.csr.num_nodes()):
+            for i in range(offsets[u], offsets[u + 1]):
+                weights[i] = max(0.0, self.csr.weights[i] + h[u] - h[targets[i]])
+        self.reweighted = CSRGraph(self.csr.names, offsets, targets, weights)
+        self.engine = DijkstraCSR(self.reweighted)  # para shortest_path
+
+    def _restore(self, source, target, reduced):
+        # d(s, t) = d'(s, t) - h(s) + h(t)
+        return reduced - self.potential[source] + self.potential[target]
+
+    def iter_distance_rows(self, origins, destinations=None, workers=1, chunksize=16):
+        # Un Dijkstra no negativo por origen, repartidos entre procesos
+        destinations = list(destinations) if destinations is not None else list(self.csr.names)
+        origin_ids = [self.csr.id_of(name) for name in origins]
+        destination_ids = [self.csr.id_of(name) for name in destinations]
+        rows = iter_distance_rows(self.reweighted, origins, destinations, workers, chunksize)
+        for i, row in rows:
+            s = origin_ids[i]
+            yield i, array('d', (self._restore(s, t, d) for t, d in zip(destination_ids, row)))
+
+    def distance_matrix(self, origins=None, destinations=None, workers=1, chunksize=16):
+        origins = list(origins) if origins is not None else list(self.csr.names)
+        destinations = list(destinations) if destinations is not None else list(self.csr.names)
+        data = array('d')
+        for _, row in self.iter_distance_rows(origins, destinations, workers, chunksize):
+            data.extend(row)
+        return DistanceMatrix(origins, destinations, data)
+
+    def shortest_path(self, start_name, destination_name):
+        start = self.csr.id_of(start_name)
+        dest = self.csr.id_of(destination_name)
+        if start is None or dest is None:
+            raise ValueError("Origen o destino inexistente")
+
+        engine = self.engine
+        engine.run_id(start, stop_at=[dest])
+        if engine.dist[dest] == float('inf'):
+            return float('inf'), []
+        return self._restore(start, dest, engine.dist[dest]), engine.get_path(destination_name)
+
+
+def johnson(graph, origins=None, destinations=None, workers=1, chunksize=16):
+    return Johnson(graph).distance_matrix(origins, destinations, workers, chunksize)
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    import random
+
+    # Rebajas: pesos negativos, pero sin ciclos negativos (w = base + p(v) - p(u))
+    rng = random.Random(9)
+    n = 400
+    price = [rng.randint(0, 50) for _ in range(n)]
+    g = Graph()
+    for u in range(n):
+        g.add_node(u)
+    for u in range(n):
+        for _ in range(3):
+            v = rng.randrange(n)
+            g.add_edge(u, v, rng.randint(1, 20) + price[v] - price[u])
+
+    engine = Johnson(g)
+    origins = rng.sample(range(n), 20)
+    matrix = engine.distance_matrix(origins, workers=2)
+
+    reference = BellmanFord(g)
+    for origin in origins:
+        reference.run(origin)
+        assert all(abs(matrix.get(origin, t) - reference.get_distance(t)) < 1e-9
+                   or matrix.get(origin, t) == reference.get_distance(t) for t in range(n))
+    negative = sum(1 for w in engine.csr.weights if w < 0)
+    print(f"{negative} aristas negativas; {len(origins)} filas idénticas a Bellman-Ford")
+
+    cost, path = engine.shortest_path(origins[0], origins[1])
+    print(f"{origins[0]} → {origins[1]}: {path} (coste: {cost})")
+
+    g.add_edge("X", "Y", 2)
+    g.add_edge("Y", "Z", -5)
+    g.add_edge("Z", "X", 1)
+    try:
+        Johnson(g)
+    except NegativeCycleError as error:
+        print(f"Detectado: {error} (testigo: {error.cycle})")
@@ -0,0 +1,193 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from Djkstra_sin_paja import Graph, AVLTree, DijkstraCSR
+
+
+# ===========================================================
+#        TABLAS DE DISTANCIAS (POR PROCESO TRABAJADOR)
+# ===========================================================
+
+_worker_graphs = None
+
+
+def _init_worker(csr, reverse):
+    global _worker_graphs
+    _worker_graphs = (csr, reverse)
+
+
+def _distances_from(csr, source):
+    engine = DijkstraCSR(csr)
+    engine.run_id(source)
+    return engine.dist
+
+
+def _landmark_tables(landmark):
+    csr, reverse = _worker_graphs
+    # forward: d(L, v); backward: d(v, L) = Dijkstra sobre el grafo traspuesto
+    return _distances_from(csr, landmark), _distances_from(reverse, landmark)
+
+
+# ===========================================================
+#            TDA: LANDMARK INDEX (ALT)
+# ===========================================================
+
+class LandmarkIndex:
+    def __init__(self, graph, k=8, strategy="farthest", workers=1, seed=0, queue=AVLTree):
+        if strategy not in ("farthest", "degree"):
+            raise ValueError(f"Estrategia '{strategy}' desconocida")
+        self.graph = graph
+        self.k = k
+        self.strategy = strategy
+        self.seed = seed
+        self.queue = queue
+        self.settled = 0
+
+        self.landmarks = None  # se eligen en la primera congelación
+        self.forward = []
+        self.backward = []
+        self.rebuild_tables(workers)
+
+    # -------------------- Selección de landmarks --------------------
+
+    def _select_landmarks(self):
+        n = self.csr.num_nodes()
+        k = min(self.k, n)
+        if k == 0:
+            return []
+
+        if self.strategy == "degree":
+            in_degree = [0] * n
+            for v in self.csr.targets:
+                in_degree[v] += 1
+            offsets = self.csr.offsets
+            degree = [offsets[u + 1] - offsets[u] + in_degree[u] for u in range(n)]
+            return sorted(range(n), key=lambda u: -degree[u])[:k]
+
+        # Farthest-first: cada landmark maximiza la distancia a los ya elegidos
+        landmarks = [random.Random(self.seed).randrange(n)]
+        closest = list(_distances_from(self.csr, landmarks[0]))
+        while len(landmarks) < k:
+            candidates = [u for u in range(n)
+                          if u not in landmarks and closest[u] != float('inf')]
+            if not candidates:
+                candidates = [u for u in range(n) if u not in landmarks]
+            landmark = max(candidates, key=lambda u: closest[u])
+            landmarks.append(landmark)
+            for u, d in enumerate(_distances_from(self.csr, landmark)):
+                if d < closest[u]:
+                    closest[u] = d
+        return landmarks
+
+    # -------------------- Tablas --------------------
+
+    def rebuild_tables(self, workers=1):
+        # Tras cambiar pesos: se recongela el grafo y se recalculan solo las tablas
+        self.csr = self.graph.freeze()
+        self.reverse = self.csr.reverse()
+        if self.landmarks is None:
+            self.landmarks = self._select_landmarks()
+
+        if workers <= 1 or len(self.landmarks) <= 1:
+            _init_worker(self.csr, self.reverse)
+            tables = [_landmark_tables(l) for l in self.landmarks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.csr, self.reverse)) as pool:
+                tables = list(pool.map(_landmark_tables, self.landmarks))
+
+        self.forward = [f for f, _ in tables]
+        self.backward = [b for _, b in tables]
+
+    def heuristic(self, v, t):
+        # Desigualdad triangular: d(v,t) >= d(L,t) - d(L,v) y d(v,t) >= d(v,L) - d(t,L)
+        best = 0
+        inf = float('inf')
+        for forward, backward in zip(self.forward, self.backward):
+            if forward[t] != inf and forward[v] != inf:
+                best = max(best, forward[t] - forward[v])
+            if backward[v] != inf and backward[t] != inf:
+                best = max(best, backward[v] - backward[t])
+        return best
+
+    # -------------------- Consultas --------------------
+
+    def shortest_path(self, source_name, target_name):
+        source = self.csr.id_of(source_name)
+        target = self.csr.id_of(target_name)
+        if source is None:
+            raise ValueError(f"Nodo '{source_name}' no existe")
+        if target is None:
+            raise ValueError(f"Nodo '{target_name}' no existe")
+
+        offsets, targets, weights = self.csr.offsets, self.csr.targets, self.csr.weights
+        dist = {source: 0}
+        previous = {source: -1}
+        closed = set()
+        self.settled = 0
+
+        pq = self.queue()
+        pq.insert(self.heuristic(source, target), source)
+
+        while not pq.is_empty():
+            _, u = pq.extract_min()
+            if u in closed:
+                continue
+            closed.add(u)
+            self.settled += 1
+
+            if u == target:
+                path = []
+                while u != -1:
+                    path.append(self.csr.names[u])
+                    u = previous[u]
+                return dist[target], path[::-1]
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_dist = dist[u] + weights[i]
+                if new_dist < dist.get(v, float('inf')):
+                    dist[v] = new_dist
+                    previous[v] = u
+                    pq.insert(new_dist + self.heuristic(v, target), v)
+
+        return float('inf'), []
+
+    def distance(self, source_name, target_name):
+        return self.shortest_path(source_name, target_name)[0]
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    from Djkstra_sin_paja import Dijkstra
+
+    rng = random.Random(7)
+    g = Graph()
+    size = 30
+    for x in range(size):
+        for y in range(size):
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= x + dx < size and 0 <= y + dy < size:
+                    g.add_edge((x, y), (x + dx, y + dy), rng.randint(1, 9))
+
+    index = LandmarkIndex(g, k=4, strategy="farthest")
+    dijkstra = Dijkstra(g)
+    dijkstra.run((0, 0))
+
+    distance, path = index.shortest_path((0, 0), (25, 20))
+    assert distance == dijkstra.get_distance((25, 20))
+    print(f"Landmarks: {[index.csr.names[l] for l in index.landmarks]}")
+    print(f"(0,0) → (25,20): distancia {distance}, {len(path)} nodos, "
+          f"fijados {index.settled} de {index.csr.num_nodes()}")
+
+    # Cambian unos pocos pesos: se reconstruyen solo las tablas, en paralelo
+    for edge in g.get_node((10, 10)).edges:
+        edge.weight += 20
+    index.rebuild_tables(workers=2)
+    dijkstra.run((0, 0))
+    distance, _ = index.shortest_path((0, 0), (25, 20))
+    assert distance == dijkstra.get_distance((25, 20))
+    print(f"Tras actualizar pesos: distancia {distance}, fijados {index.settled}")
@@ -0,0 +1,123 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from Djkstra_sin_paja import Graph, CSRGraph, BinaryHeap, DijkstraCSR
+
+
+# ===========================================================
+#          BÚSQUEDA POR FILA (POR PROCESO TRABAJADOR)
+# ===========================================================
+
+# Estado de solo lectura de cada trabajador, fijado una vez en el initializer
+_worker_state = None
+
+
+def _init_worker(csr, destination_ids):
+    global _worker_state
+    _worker_state = (DijkstraCSR(csr, BinaryHeap), destination_ids)
+
+
+def _distance_row(origin_id):
+    engine, destination_ids = _worker_state
+    # Se corta en cuanto todos los destinos están fijados
+    engine.run_id(origin_id, stop_at=destination_ids)
+    dist = engine.dist
+    return array('d', (dist[t] for t in destination_ids))
+
+
+# ===========================================================
+#                 TDA: DISTANCE MATRIX
+# ===========================================================
+
+class DistanceMatrix:
+    # Matriz densa de doubles en orden fila-mayor: data[i * cols + j]
+    def __init__(self, origins, destinations, data):
+        self.origins = list(origins)
+        self.destinations = list(destinations)
+        self.rows = len(self.origins)
+        self.cols = len(self.destinations)
+        self.data = data
+        self._row_of = {name: i for i, name in enumerate(self.origins)}
+        self._col_of = {name: j for j, name in enumerate(self.destinations)}
+
+    def row(self, i):
+        return self.data[i * self.cols:(i + 1) * self.cols]
+
+    def get(self, origin_name, destination_name):
+        i = self._row_of[origin_name]
+        j = self._col_of[destination_name]
+        return self.data[i * self.cols + j]
+
+    def to_bytes(self):
+        return self.data.tobytes()
+
+
+# ===========================================================
+#                 API: DISTANCE MATRIX
+# ===========================================================
+
+def _resolve(csr, names):
+    ids = []
+    for name in names:
+        node_id = csr.id_of(name)
+        if node_id is None:
+            raise ValueError(f"Nodo '{name}' no existe")
+        ids.append(node_id)
+    return ids
+
+
+def iter_distance_rows(graph, origins, destinations, workers=1, chunksize=16):
+    # Genera (i, fila) en el orden de origins a medida que se calculan
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    origin_ids = _resolve(csr, origins)
+    destination_ids = _resolve(csr, destinations)
+
+    if not destination_ids:
+        for i in range(len(origin_ids)):
+            yield i, array('d')
+        return
+
+    if workers <= 1:
+        _init_worker(csr, destination_ids)
+        for i, origin_id in enumerate(origin_ids):
+            yield i, _distance_row(origin_id)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(csr, destination_ids)) as pool:
+        for i, row in enumerate(pool.map(_distance_row, origin_ids, chunksize=chunksize)):
+            yield i, row
+
+
+def distance_matrix(graph, origins, destinations, workers=1, chunksize=16):
+    origins = list(origins)
+    destinations = list(destinations)
+    data = array('d')
+    for _, row in iter_distance_rows(graph, origins, destinations, workers, chunksize):
+        data.extend(row)
+    return DistanceMatrix(origins, destinations, data)
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+
+if __name__ == "__main__":
+    g = Graph()
+    g.add_edge("A", "B", 4)
+    g.add_edge("A", "C", 2)
+    g.add_edge("C", "B", 1)
+    g.add_edge("B", "D", 5)
+    g.add_edge("C", "D", 8)
+    g.add_edge("C", "E", 10)
+    g.add_edge("D", "E", 2)
+    g.add_edge("D", "F", 6)
+    g.add_edge("E", "F", 3)
+
+    origins = ["A", "B", "C"]
+    destinations = ["D", "E", "F"]
+    matrix = distance_matrix(g, origins, destinations, workers=2)
+
+    print("      " + "".join(f"{d:>8}" for d in destinations))
+    for i, origin in enumerate(origins):
+        print(f"{origin:>6}" + "".join(f"{x:>8}" for x in matrix.row(i)))
@@ -0,0 +1,201 @@
+from Djkstra_sin_paja import Graph, Dijkstra, SearchResult, AVLTree
+
+
+# ===========================================================
+#            ÁRBOL DE CAMINOS MÍNIMOS EXISTENTE
+# ===========================================================
+
+def tree_from_nodes(graph, source_name):
+    # Adopta el árbol que Dijkstra.run dejó en GraphNode.distance/previous
+    source = graph.get_node(source_name)
+    if not source:
+        raise ValueError(f"Nodo '{source_name}' no existe")
+    dist, prev = {}, {}
+    for node in graph.node_list:
+        if node.distance != float('inf'):
+            dist[node.id] = node.distance
+            prev[node.id] = node.previous.id if node.previous else -1
+    return SearchResult(graph, source, dist, prev)
+
+
+def _edge_weight(source, destination):
+    # Con aristas paralelas cuenta la más barata
+    return min((edge.weight for edge in source.find_edges(destination)), default=float('inf'))
+
+
+# ===========================================================
+#     REPARACIÓN INCREMENTAL (INSERCIONES Y BAJADAS DE PESO)
+# ===========================================================
+
+class IncrementalSSSP:
+    def __init__(self, graph, max_fraction=0.25, queue=AVLTree):
+        self.graph = graph
+        self.max_fraction = max_fraction  # umbral para recalcular desde cero
+        self.queue = queue
+        self.affected = 0
+        self.fallback = False
+
+    def _recompute(self, tree):
+        fresh = Dijkstra(self.graph).query(tree.source.name)
+        tree.dist, tree.prev, tree.order = fresh.dist, fresh.prev, fresh.order
+        self.fallback = True
+        return tree
+
+    def apply_decreases(self, tree, changed_edges):
+        # changed_edges: pares (origen, destino) ya insertados o abaratados en el grafo
+        dist, prev = tree.dist, tree.prev
+        tree.order = None  # el orden de fijación deja de valer; se rehace al pedirlo
+        limit = self.max_fraction * len(self.graph.node_list)
+        self.affected = 0
+        self.fallback = False
+
+        pq = self.queue()
+        for source_name, destination_name in changed_edges:
+            u = self.graph.get_node(source_name)
+            v = self.graph.get_node(destination_name)
+            if u is None or v is None or u.id not in dist:
+                continue
+            new_dist = dist[u.id] + _edge_weight(u, v)
+            if new_dist < dist.get(v.id, float('inf')):
+                dist[v.id] = new_dist
+                prev[v.id] = u.id
+                pq.insert(new_dist, v)
+
+        # Solo se propaga por la región cuya distancia mejora
+        while not pq.is_empty():
+            d, node = pq.extract_min()
+            if d > dist[node.id]:
+                continue
+
+            self.affected += 1
+            if self.affected > limit:
+                return self._recompute(tree)
+
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = d + edge.weight
+                if new_dist < dist.get(neighbor.id, float('inf')):
+                    dist[neighbor.id] = new_dist
+                    prev[neighbor.id] = node.id
+                    pq.insert(new_dist, neighbor)
+
+        return tree
+
+    # -------------------- Subidas de peso y borrados --------------------
+
+    def apply_increases(self, tree, changed_edges):
+        # changed_edges: pares (origen, destino) encarecidos o borrados en el grafo.
+        # Un par que en realidad se abarató se repara después con apply_decreases
+        dist, prev = tree.dist, tree.prev
+        tree.order = None  # el orden de fijación deja de valer; se rehace al pedirlo
+        self.affected = 0
+        self.fallback = False
+
+        # Solo importan las aristas del árbol: el resto no sostiene ningún camino
+        roots = []
+        cheaper = []
+        for source_name, destination_name in changed_edges:
+            u = self.graph.get_node(source_name)
+            v = self.graph.get_node(destination_name)
+            if u is None or v is None or u.id not in dist:
+                continue
+            new_dist = dist[u.id] + _edge_weight(u, v)
+            if new_dist < dist.get(v.id, float('inf')):
+                cheaper.append((source_name, destination_name))
+            elif prev.get(v.id) == u.id and new_dist != dist[v.id]:
+                roots.append(v.id)
+
+        if roots:
+            self._repair_subtrees(tree, roots)
+        if cheaper and not self.fallback:
+            # Con el subárbol ya reparado todas las distancias son cotas válidas
+            affected = self.affected
+            self.apply_decreases(tree, cheaper)
+            self.affected += affected
+        return tree
+
+    def _repair_subtrees(self, tree, roots):
+        dist, prev = tree.dist, tree.prev
+        node_list = self.graph.node_list
+        limit = self.max_fraction * len(node_list)
+
+        children = {}
+        for child, parent in prev.items():
+            children.setdefault(parent, []).append(child)
+
+        # Subárbol colgado de las aristas cambiadas: sus distancias dejan de valer
+        subtree = set()
+        stack = roots
+        while stack:
+            x = stack.pop()
+            if x in subtree:
+                continue
+            subtree.add(x)
+            stack.extend(children.get(x, ()))
+            if len(subtree) > limit:
+                return self._recompute(tree)
+        self.affected = len(subtree)
+
+        for x in subtree:
+            del dist[x]
+            del prev[x]
+
+        # Frontera: mejor entrada desde un nodo que conserva su distancia
+        pq = self.queue()
+        for x in subtree:
+            node = node_list[x]
+            for edge in self.graph.reverse_edges(node):
+                y = edge.source.id
+                if y in dist and y not in subtree:
+                    new_dist = dist[y] + edge.weight
+                    if new_dist < dist.get(x, float('inf')):
+                        dist[x] = new_dist
+                        prev[x] = y
+            if x in dist:
+                pq.insert(dist[x], node)
+
+        # Dijkstra desde la frontera: en la práctica no sale del subárbol, salvo
+        # que una arista abaratada lo deje por debajo de la distancia de fuera
+        while not pq.is_empty():
+            d, node = pq.extract_min()
+            if d > dist[node.id]:
+                continue
+            for edge in node.edges:
+                neighbor = edge.destination
+                new_dist = d + edge.weight
+                if new_dist < dist.get(neighbor.id, float('inf')):
+                    dist[neighbor.id] = new_dist
+                    prev[neighbor.id] = node.id
+                    pq.insert(new_dist, neighbor)
+
+        return tree
+
+
+# ===========================================================
+#                    EJEMPLO DE USO
+# ===========================================================
+#
+# La comprobación aleatoria contra un Dijkstra nuevo está en
+# test_sssp_dinamico.py (python -m pytest test_sssp_dinamico.py).
+
+if __name__ == "__main__":
+    g = Graph()
+    for u, v, w in [("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 5), ("C", "D", 8)]:
+        g.add_edge(u, v, w)
+
+    Dijkstra(g).run("A")
+    tree = tree_from_nodes(g, "A")
+    repair = IncrementalSSSP(g, max_fraction=1.0)  # grafo diminuto: sin recálculo completo
+    print(f"A → D: {tree.get_path('D')} (distancia: {tree.get_distance('D')})")
+
+    # Se abre un atajo C → D
+    g.add_edge("C", "D", 3)
+    repair.apply_decreases(tree, [("C", "D")])
+    print(f"Tras abrir C → D: {tree.get_path('D')} (distancia: {tree.get_distance('D')}, "
+          f"{repair.affected} nodos revisados)")
+
+    # Se corta A → C
+    g.remove_edge("A", "C")
+    repair.apply_increases(tree, [("A", "C")])
+    print(f"Tras cortar A → C: {tree.get_path('D')} (distancia: {tree.get_distance('D')}, "
+          f"{repair.affected} nodos revisados)")
@@ -0,0 +1,154 @@
+import random
+
+from Djkstra_sin_paja import Graph, Dijkstra
+from sssp_dinamico import IncrementalSSSP, tree_from_nodes, _edge_weight
+
+
+def random_graph(rng, n=200, degree=3):
+    g = Graph()
+    for u in range(n):
+        g.add_node(u)
+    for u in range(n):
+        for _ in range(degree):
+            g.add_edge(u, rng.randrange(n), rng.randint(5, 50))
+    return g
+
+
+def initial_tree(g):
+    Dijkstra(g).run(0)
+    return tree_from_nodes(g, 0)
+
+
+def assert_matches_fresh_run(g, tree):
+    # Distancias iguales a un Dijkstra nuevo y caminos con el coste anunciado
+    fresh = Dijkstra(g).query(0)
+    for name in g.nodes:
+        assert tree.get_distance(name) == fresh.get_distance(name), name
+        path = tree.get_path(name)
+        cost = sum(_edge_weight(g.get_node(a), g.get_node(b)) for a, b in zip(path, path[1:]))
+        assert not path or cost == tree.get_distance(name), name
+
+
+def test_insertions_match_fresh_run():
+    rng = random.Random(1)
+    for _ in range(10):
+        g = random_graph(rng)
+        tree = initial_tree(g)
+        repair = IncrementalSSSP(g, max_fraction=1.0)
+        for _ in range(10):
+            changed = []
+            for _ in range(rng.randint(1, 3)):
+                u, v = rng.randrange(200), rng.randrange(200)
+                g.add_edge(u, v, rng.randint(1, 10))
+                changed.append((u, v))
+            repair.apply_decreases(tree, changed)
+            assert not repair.fallback
+            assert_matches_fresh_run(g, tree)
+
+
+def test_weight_decreases_match_fresh_run():
+    rng = random.Random(2)
+    for _ in range(10):
+        g = random_graph(rng)
+        tree = initial_tree(g)
+        repair = IncrementalSSSP(g, max_fraction=1.0)
+        for _ in range(10):
+            changed = []
+            for _ in range(rng.randint(1, 3)):
+                edge = rng.choice(rng.choice(g.node_list).edges)
+                u, v = edge.source.name, edge.destination.name
+                g.set_weight(u, v, max(1, edge.weight - rng.randint(1, 30)))
+                changed.append((u, v))
+            repair.apply_decreases(tree, changed)
+            assert_matches_fresh_run(g, tree)
+
+
+def test_increases_and_removals_match_fresh_run():
+    rng = random.Random(3)
+    for _ in range(10):
+        g = random_graph(rng)
+        tree = initial_tree(g)
+        repair = IncrementalSSSP(g, max_fraction=1.0)
+        for _ in range(10):
+            changed = []
+            for _ in range(rng.randint(1, 3)):
+                v = rng.choice(list(tree.prev))
+                u = tree.prev[v]
+                if u == -1 or not g.get_node(u).find_edges(g.get_node(v)):
+                    continue
+                if rng.random() < 0.5:
+                    g.remove_edge(u, v)
+                else:
+                    old = _edge_weight(g.get_node(u), g.get_node(v))
+                    g.set_weight(u, v, old + rng.randint(1, 40))
+                changed.append((u, v))
+            repair.apply_increases(tree, changed)
+            assert_matches_fresh_run(g, tree)
+
+
+def test_max_fraction_fallback_recomputes_from_scratch():
+    rng = random.Random(4)
+    g = random_graph(rng)
+    tree = initial_tree(g)
+    repair = IncrementalSSSP(g, max_fraction=0.0)
+
+    # Un atajo desde el origen mejora al menos un nodo: supera el umbral 0
+    target = max(tree.dist, key=tree.dist.get)
+    g.add_edge(0, target, 1)
+    repair.apply_decreases(tree, [(0, target)])
+    assert repair.fallback
+    assert tree.order is not None
+    assert_matches_fresh_run(g, tree)
+
+    # Cortar la arista de árbol que llega a un nodo invalida su subárbol
+    v = next(x for x, u in tree.prev.items()
+             if u != -1 and len(g.get_node(u).find_edges(g.get_node(x))) == 1)
+    u = tree.prev[v]
+    g.remove_edge(u, v)
+    repair.apply_increases(tree, [(u, v)])
+    assert repair.fallback
+    assert_matches_fresh_run(g, tree)
+
+
+def test_below_max_fraction_repairs_in_place():
+    rng = random.Random(5)
+    g = random_graph(rng)
+    tree = initial_tree(g)
+    repair = IncrementalSSSP(g, max_fraction=1.0)
+
+    target = max(tree.dist, key=tree.dist.get)
+    g.add_edge(0, target, 1)
+    repair.apply_decreases(tree, [(0, target)])
+    assert not repair.fallback
+    assert 0 < repair.affected <= len(g.node_list)
+    assert_matches_fresh_run(g, tree)
+
+
+def test_increases_with_cheaper_pairs_match_fresh_run():
+    # Pares abaratados mezclados en apply_increases: se reparan como bajadas
+    rng = random.Random(6)
+    for _ in range(10):
+        g = random_graph(rng)
+        tree = initial_tree(g)
+        repair = IncrementalSSSP(g, max_fraction=1.0)
+        for _ in range(10):
+            changed = []
+            for _ in range(rng.randint(1, 4)):
+                edge = rng.choice(rng.choice(g.node_list).edges)
+                u, v = edge.source.name, edge.destination.name
+                g.set_weight(u, v, max(1, edge.weight + rng.randint(-30, 30)))
+                changed.append((u, v))
+            repair.apply_increases(tree, changed)
+            assert_matches_fresh_run(g, tree)
+
+
+def test_remove_edge_drops_parallel_edges():
+    g = Graph()
+    g.add_edge("A", "B", 3)
+    g.add_edge("A", "B", 7)
+    g.add_edge("A", "C", 1)
+    g.reverse_edges(g.get_node("B"))
+    removed = g.remove_edge("A", "B")
+    assert sorted(edge.weight for edge in removed) == [3, 7]
+    assert g.get_node("A").find_edges(g.get_node("B")) == []
+    assert g.reverse_edges(g.get_node("B")) == []